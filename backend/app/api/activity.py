@@ -1,11 +1,215 @@
 """Helpers to record request/response activity."""
 
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Tuple
+
+import orjson
+from loguru import logger
+
+_Entry = Tuple[int, str, str, str, Optional[Dict[str, Any]], Optional[Any], str, str]
+
+# Pre-rendered JSON fragments for the stable per-route fields. Keys repeat
+# across entries (same action/method/source, and usually the same endpoint),
+# so the fragment is encoded once and reused; bounded because endpoints with
+# path parameters produce distinct strings per resource id.
+_PREFIX_CACHE: Dict[Tuple[str, str, str, str], bytes] = {}
+_PREFIX_CACHE_MAX = 1024
+
+
+def _json_default(obj: Any) -> Any:
+    """Coerce non-native types (e.g. MappingProxyType sentinels) for orjson."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _entry_prefix(action: str, method: str, endpoint: str, source: str) -> bytes:
+    """Return the cached JSON fragment for an entry's stable fields."""
+    key = (action, method, endpoint, source)
+    prefix = _PREFIX_CACHE.get(key)
+    if prefix is None:
+        prefix = orjson.dumps(
+            {"action": action, "method": method, "endpoint": endpoint, "source": source}
+        )[:-1]
+        if len(_PREFIX_CACHE) < _PREFIX_CACHE_MAX:
+            _PREFIX_CACHE[key] = prefix
+    return prefix
+
+
+def _format_entry(entry: _Entry) -> bytes:
+    """Serialize a raw entry tuple into its JSON bytes form.
+
+    Entries are only ever read back as JSON, so serializing once at flush
+    time (and storing the denser bytes) beats keeping dicts around and
+    re-encoding them on every activity-log read. The stable fields come
+    from the prefix cache; only the variable tail is encoded per entry.
+    """
+    ts_ns, action, method, endpoint, payload, response, status, source = entry
+    iso = datetime.fromtimestamp(ts_ns / 1_000_000_000, timezone.utc).isoformat()
+    tail = orjson.dumps(
+        {"timestamp": iso, "payload": payload, "response": response, "status": status},
+        default=_json_default,
+    )
+    return _entry_prefix(action, method, endpoint, source) + b"," + tail[1:]
+
+
+class ActivityRecorder:
+    """Queue-backed activity log flushed to a ring buffer in batches.
+
+    Endpoints enqueue lightweight tuples via :func:`record_activity`; a
+    background task started from the application lifespan drains the queue
+    and extends the underlying deque of serialized JSON entries, keeping
+    dict construction and buffer writes off the request hot path. Reads
+    (``len``/iteration/``clear``) drain any queued entries first so callers
+    always see a consistent view.
+    """
+
+    def __init__(
+        self,
+        log: Deque[bytes],
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        record_success: bool = True,
+        drop_full: bool = False,
+    ) -> None:
+        self._log = log
+        self._record_success = record_success
+        self._drop_full = drop_full
+        self._queue: "asyncio.Queue[_Entry]" = asyncio.Queue()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._wakeup = asyncio.Event()
+        self._suppress_wakeup = False
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Launch the background flusher task on the running loop."""
+        self._task = asyncio.create_task(self._flusher())
+
+    async def stop(self) -> None:
+        """Cancel the flusher and persist any still-queued entries."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._drain()
+
+    def accepts(self, status: str) -> bool:
+        """Whether an entry with this status should be recorded at all.
+
+        Success entries can be switched off entirely, or dropped once the
+        ring buffer is full, so hot endpoints skip even the tuple build.
+        Error entries are always kept.
+        """
+        if status == "success":
+            if not self._record_success:
+                return False
+            if (
+                self._drop_full
+                and self._log.maxlen is not None
+                and len(self._log) >= self._log.maxlen
+            ):
+                return False
+        return True
+
+    def put(self, entry: _Entry) -> None:
+        """Enqueue a raw entry tuple without blocking the caller."""
+        self._queue.put_nowait(entry)
+        if not self._suppress_wakeup:
+            self._wakeup.set()
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Coalesce a burst of puts into a single flusher wakeup.
+
+        Callers recording several entries for one logical operation can
+        wrap the loop so the flusher is signalled once on exit instead of
+        per entry; the entries themselves still land in the queue
+        immediately and stay visible to synchronous readers.
+        """
+        before = self._queue.qsize()
+        self._suppress_wakeup = True
+        try:
+            yield
+        finally:
+            self._suppress_wakeup = False
+            added = self._queue.qsize() - before
+            if added > 0:
+                self._wakeup.set()
+                logger.debug("Recorded activity batch of {n} entries", n=added)
+
+    def _drain(self) -> None:
+        """Synchronously move queued entries into the ring buffer."""
+        while True:
+            batch = []
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if not batch:
+                break
+            self._log.extend(_format_entry(entry) for entry in batch)
+
+    async def _flusher(self) -> None:
+        """Flush queued entries forever, coalescing bursts into one batch.
+
+        Entries are never held outside the queue or the ring buffer, so a
+        synchronous reader draining the queue always sees every recorded
+        entry regardless of flush timing.
+        """
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self._flush_interval)
+            self._wakeup.clear()
+            self._drain()
+
+    def __len__(self) -> int:
+        self._drain()
+        return len(self._log)
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._drain()
+        return iter(self._log)
+
+    def __reversed__(self) -> Iterator[bytes]:
+        self._drain()
+        return reversed(self._log)
+
+    def clear(self) -> None:
+        """Discard queued and buffered entries."""
+        self._drain()
+        self._log.clear()
+
+
+# Bound per request by ActivityLogMiddleware so record_activity reads the
+# app-global recorder without a dependency-injection node per endpoint.
+ACTIVITY_LOG_CV: ContextVar[Optional[ActivityRecorder]] = ContextVar(
+    "activity_log", default=None
+)
+
+
+class ActivityLogMiddleware:
+    """Pure-ASGI middleware binding the activity recorder into the context."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            ACTIVITY_LOG_CV.set(scope["app"].state.activity_log)
+        await self.app(scope, receive, send)
 
 
 def record_activity(
-    log: List[Dict[str, Any]],
     *,
     action: str,
     method: str,
@@ -15,17 +219,24 @@ def record_activity(
     status: str = "success",
     source: str = "live",
 ) -> None:
-    """Append a structured entry to the in-memory activity log."""
-    log.append(
-        {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "action": action,
-            "method": method,
-            "endpoint": endpoint,
-            "payload": payload,
-            "response": response,
-            "status": status,
-            "source": source,
-        }
-    )
+    """Enqueue a structured entry for the background flusher.
 
+    The timestamp is captured as ``time.time_ns()`` — a single clock read —
+    and only rendered to an ISO string when the entry is flushed, keeping
+    datetime formatting off the request hot path.
+    """
+    log = ACTIVITY_LOG_CV.get()
+    if log is None or not log.accepts(status):
+        return
+    log.put(
+        (
+            time.time_ns(),
+            action,
+            method,
+            endpoint,
+            payload,
+            response,
+            status,
+            source,
+        )
+    )
@@ -2,304 +2,180 @@
 
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Depends, Path, status
 
-from backend.app.api.activity import record_activity
-from backend.app.api.deps import get_activity_log, get_app_settings, get_travio_client
+from backend.app.api._wrap import travio_endpoint
+from backend.app.api.deps import get_app_settings, get_travio_client
 from backend.app.config import Settings
 from backend.app.models.crm import CRMClientPayload, CRMSearchRequest
-from backend.app.services.travio_client import TravioAPIError
 
 router = APIRouter(prefix="/api/crm", tags=["crm"])
 
 
+def _search_log_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive loggable query params (internal phone filter excluded)."""
+    params = kwargs["request"].to_params()
+    params.pop("_phone_filter", None)
+    return params
+
+
 @router.post("/search")
+@travio_endpoint(
+    action="crm.search",
+    method="GET",
+    endpoint="/rest/master-data",
+    error_detail="Travio CRM search failed",
+    unexpected_detail="Unexpected CRM search error",
+    log_payload=_search_log_params,
+)
 async def search_clients(
     request: CRMSearchRequest,
     client: Any = Depends(get_travio_client),
-    activity_log=Depends(get_activity_log),
 ) -> Dict[str, Any]:
     """Proxy Travio CRM search with flexible filters."""
     params = request.to_params()
     phone_filter = params.pop("_phone_filter", None)
-    try:
-        response = await client.search_clients(params)
-        if isinstance(response, dict) and "items" not in response:
-            items = response.get("list")
-            if isinstance(items, list):
-                response = {**response, "items": items}
-        if phone_filter and isinstance(response, dict):
-            items = response.get("items") or []
-            filtered_items = []
-            for item in items:
-                contacts = item.get("contacts") or []
-                phones = []
-                for contact in contacts:
-                    phones.extend(contact.get("phone") or [])
-                if any(phone_filter in phone for phone in phones):
-                    filtered_items.append(item)
-            per_page = response.get("per_page") or len(filtered_items)
-            per_page = per_page or len(filtered_items) or 1
-            response = {
-                **response,
-                "items": filtered_items,
-                "filtered_by_phone": phone_filter,
-                "total": len(filtered_items),
-                "tot": len(filtered_items),
-                "pages": 1,
-                "page": 1,
-                "per_page": per_page,
-            }
-    except TravioAPIError as exc:
-        record_activity(
-            activity_log,
-            action="crm.search",
-            method="GET",
-            endpoint="/rest/master-data",
-            payload=params,
-            status="error",
-            response={"status_code": exc.status_code, "payload": exc.payload},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Travio CRM search failed",
-        ) from exc
-    except Exception as exc:  # noqa: BLE001
-        record_activity(
-            activity_log,
-            action="crm.search",
-            method="GET",
-            endpoint="/rest/master-data",
-            payload=params,
-            status="error",
-            response={"error": str(exc)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unexpected CRM search error",
-        ) from exc
-
-    record_activity(
-        activity_log,
-        action="crm.search",
-        method="GET",
-        endpoint="/rest/master-data",
-        payload=params,
-        status="success",
-        response=response,
-    )
+    response = await client.search_clients(params)
+    if isinstance(response, dict) and "items" not in response:
+        items = response.get("list")
+        if isinstance(items, list):
+            response = {**response, "items": items}
+    if phone_filter and isinstance(response, dict):
+        items = response.get("items") or []
+        filtered_items = [
+            item
+            for item in items
+            if any(
+                phone_filter in phone
+                for contact in (item.get("contacts") or ())
+                for phone in (contact.get("phone") or ())
+            )
+        ]
+        per_page = response.get("per_page") or len(filtered_items)
+        per_page = per_page or len(filtered_items) or 1
+        response = {
+            **response,
+            "items": filtered_items,
+            "filtered_by_phone": phone_filter,
+            "total": len(filtered_items),
+            "tot": len(filtered_items),
+            "pages": 1,
+            "page": 1,
+            "per_page": per_page,
+        }
     return response
 
 
 @router.get("/categories")
+@travio_endpoint(
+    action="crm.categories",
+    method="GET",
+    endpoint="/rest/master-data-categories",
+    error_detail="Travio categories retrieval failed",
+    unexpected_detail="Unexpected categories retrieval error",
+)
 async def list_client_categories(
     client: Any = Depends(get_travio_client),
-    activity_log=Depends(get_activity_log),
 ) -> Dict[str, Any]:
     """Return master-data categories to drive CRM client creation."""
-    try:
-        response = await client.list_master_data_categories()
-    except TravioAPIError as exc:
-        record_activity(
-            activity_log,
-            action="crm.categories",
-            method="GET",
-            endpoint="/rest/master-data-categories",
-            status="error",
-            response={"status_code": exc.status_code, "payload": exc.payload},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Travio categories retrieval failed",
-        ) from exc
-    except Exception as exc:  # noqa: BLE001
-        record_activity(
-            activity_log,
-            action="crm.categories",
-            method="GET",
-            endpoint="/rest/master-data-categories",
-            status="error",
-            response={"error": str(exc)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unexpected categories retrieval error",
-        ) from exc
-
-    record_activity(
-        activity_log,
-        action="crm.categories",
-        method="GET",
-        endpoint="/rest/master-data-categories",
-        status="success",
-        response=response,
-    )
-    return response
+    return await client.list_all_master_data_categories()
 
 
 @router.get("/{client_id}")
+@travio_endpoint(
+    action="crm.detail",
+    method="GET",
+    endpoint="/rest/master-data/{client_id}",
+    error_status=status.HTTP_404_NOT_FOUND,
+    error_detail="Client not found",
+    unexpected_detail="Unexpected client retrieval error",
+)
 async def get_client(
     client_id: int = Path(..., ge=0),
     client: Any = Depends(get_travio_client),
-    activity_log=Depends(get_activity_log),
 ) -> Dict[str, Any]:
     """Return single Travio client record."""
-    try:
-        response = await client.get_client(client_id)
-    except TravioAPIError as exc:
-        record_activity(
-            activity_log,
-            action="crm.detail",
-            method="GET",
-            endpoint=f"/rest/master-data/{client_id}",
-            status="error",
-            response={"status_code": exc.status_code, "payload": exc.payload},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Client not found",
-        ) from exc
-    except Exception as exc:  # noqa: BLE001
-        record_activity(
-            activity_log,
-            action="crm.detail",
-            method="GET",
-            endpoint=f"/rest/master-data/{client_id}",
-            status="error",
-            response={"error": str(exc)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unexpected client retrieval error",
-        ) from exc
-
-    record_activity(
-        activity_log,
-        action="crm.detail",
-        method="GET",
-        endpoint=f"/rest/master-data/{client_id}",
-        status="success",
-        response=response,
-    )
-    return response
+    return await client.get_client(client_id)
 
 
 @router.post("")
+@travio_endpoint(
+    action="crm.create",
+    method="POST",
+    endpoint="/rest/master-data",
+    error_status=status.HTTP_400_BAD_REQUEST,
+    error_detail="Travio CRM create failed",
+    unexpected_detail="Unexpected CRM create error",
+    log_payload=lambda kwargs: kwargs["payload"].data,
+)
 async def create_client(
     payload: CRMClientPayload,
     client: Any = Depends(get_travio_client),
-    settings: Settings = Depends(get_app_settings),
-    activity_log=Depends(get_activity_log),
 ) -> Dict[str, Any]:
     """Create a new Travio client."""
-    normalized = _prepare_client_payload(payload.data, settings, include_defaults=True)
-    try:
-        response = await client.create_client(normalized)
-    except TravioAPIError as exc:
-        record_activity(
-            activity_log,
-            action="crm.create",
-            method="POST",
-            endpoint="/rest/master-data",
-            payload=payload.data,
-            status="error",
-            response={"status_code": exc.status_code, "payload": exc.payload},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Travio CRM create failed",
-        ) from exc
-    except Exception as exc:  # noqa: BLE001
-        record_activity(
-            activity_log,
-            action="crm.create",
-            method="POST",
-            endpoint="/rest/master-data",
-            payload=payload.data,
-            status="error",
-            response={"error": str(exc)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unexpected CRM create error",
-        ) from exc
-
-    record_activity(
-        activity_log,
-        action="crm.create",
-        method="POST",
-        endpoint="/rest/master-data",
-        payload=payload.data,
-        status="success",
-        response=response,
+    normalized = _prepare_client_payload(
+        payload.data, get_app_settings(), include_defaults=True
     )
-    return response
+    return await client.create_client(normalized)
 
 
 @router.put("/{client_id}")
+@travio_endpoint(
+    action="crm.update",
+    method="PUT",
+    endpoint="/rest/master-data/{client_id}",
+    error_status=status.HTTP_400_BAD_REQUEST,
+    error_detail="Travio CRM update failed",
+    unexpected_detail="Unexpected CRM update error",
+    log_payload=lambda kwargs: kwargs["payload"].data,
+)
 async def update_client(
     payload: CRMClientPayload,
     client_id: int = Path(..., ge=0),
     client: Any = Depends(get_travio_client),
-    settings: Settings = Depends(get_app_settings),
-    activity_log=Depends(get_activity_log),
 ) -> Dict[str, Any]:
     """Update an existing Travio client."""
     normalized = _prepare_client_payload(
-        payload.data, settings, include_defaults=False
+        payload.data, get_app_settings(), include_defaults=False
     )
-    try:
-        response = await client.update_client(client_id, normalized)
-    except TravioAPIError as exc:
-        record_activity(
-            activity_log,
-            action="crm.update",
-            method="PUT",
-            endpoint=f"/rest/master-data/{client_id}",
-            payload=payload.data,
-            status="error",
-            response={"status_code": exc.status_code, "payload": exc.payload},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Travio CRM update failed",
-        ) from exc
-    except Exception as exc:  # noqa: BLE001
-        record_activity(
-            activity_log,
-            action="crm.update",
-            method="PUT",
-            endpoint=f"/rest/master-data/{client_id}",
-            payload=payload.data,
-            status="error",
-            response={"error": str(exc)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unexpected CRM update error",
-        ) from exc
+    return await client.update_client(client_id, normalized)
+
+
+# Keys consumed during normalization rather than copied through verbatim
+# ("marketing" is dropped outright).
+_DERIVED_KEYS = frozenset(
+    ("firstname", "first_name", "lastname", "last_name", "email", "phone", "country", "marketing")
+)
+
 
-    record_activity(
-        activity_log,
-        action="crm.update",
-        method="PUT",
-        endpoint=f"/rest/master-data/{client_id}",
-        payload=payload.data,
-        status="success",
-        response=response,
-    )
-    return response
 def _prepare_client_payload(
     data: Dict[str, Any],
     settings: Settings,
     *,
     include_defaults: bool = True,
 ) -> Dict[str, Any]:
-    """Normalize frontend payload into Travio REST master-data format."""
-    payload = {k: v for k, v in data.items() if v is not None}
+    """Normalize frontend payload into Travio REST master-data format.
+
+    The input is walked exactly once: keys that feed derivations are
+    captured as locals and everything else is copied straight through,
+    instead of filtering the dict and then re-probing it with a chain of
+    pop/get/setdefault calls.
+    """
+    payload: Dict[str, Any] = {}
+    derived: Dict[str, Any] = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        if key in _DERIVED_KEYS:
+            derived[key] = value
+        else:
+            payload[key] = value
 
-    first = payload.pop("firstname", payload.pop("first_name", None))
-    last = payload.pop("lastname", payload.pop("last_name", None))
+    first = derived.get("firstname", derived.get("first_name"))
+    last = derived.get("lastname", derived.get("last_name"))
+    email = derived.get("email")
+    phone = derived.get("phone")
+    country = derived.get("country")
 
     name = payload.get("name")
     if first:
@@ -314,10 +190,12 @@ def _prepare_client_payload(
     elif "surname" not in payload and name and " " in name:
         payload["surname"] = name.split(" ", 1)[1]
 
-    email = payload.pop("email", None)
-    phone = payload.pop("phone", None)
     contacts = payload.get("contacts")
     if not contacts and (email or phone):
+        # Deliberately a fresh dict per call: the payload escapes the request
+        # (handed to the HTTP client, and retained by the mock client's
+        # in-memory store), so pooling/reusing the template would alias live
+        # client data.
         payload["contacts"] = [
             {
                 "name": "Primary",
@@ -327,12 +205,9 @@ def _prepare_client_payload(
             }
         ]
 
-    country = payload.pop("country", None)
     if country:
         payload.setdefault("vat_country", country)
 
-    payload.pop("marketing", None)
-
     categories = payload.get("categories")
     if categories is not None:
         if isinstance(categories, (int, str)):
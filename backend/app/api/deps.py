@@ -1,26 +1,27 @@
 """FastAPI dependency helpers."""
 
-from typing import Any, Dict, List
-
-from fastapi import Depends, Request
+from functools import lru_cache
+from typing import Any, Optional
 
 from backend.app.config import Settings, get_settings
 
+# Bound during lifespan startup; the client never changes afterwards, so the
+# dependency returns it without touching request/app state per call.
+_travio_client: Optional[Any] = None
+
 
+@lru_cache(maxsize=1)
 def get_app_settings() -> Settings:
-    """Provide application settings."""
+    """Provide application settings (memoized across requests)."""
     return get_settings()
 
 
-def get_travio_client(
-    request: Request, settings: Settings = Depends(get_app_settings)
-) -> Any:
-    """Retrieve Travio client from app state."""
-    client = request.app.state.travio_client  # type: ignore[attr-defined]
-    return client
+def set_travio_client(client: Any) -> None:
+    """Bind the Travio client resolved at startup."""
+    global _travio_client
+    _travio_client = client
 
 
-def get_activity_log(request: Request) -> List[Dict[str, Any]]:
-    """Return activity log stored in app state."""
-    log: List[Dict[str, Any]] = request.app.state.activity_log  # type: ignore[attr-defined]
-    return log
+def get_travio_client() -> Any:
+    """Retrieve the Travio client bound at startup."""
+    return _travio_client
@@ -1,44 +1,56 @@
 """System utilities endpoints."""
 
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, Query
-
-from backend.app.api.deps import get_activity_log, get_app_settings
-from backend.app.config import Settings
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(prefix="/api/system", tags=["system"])
 
-
-@router.get("/health")
-async def health(
-    settings: Settings = Depends(get_app_settings),
-) -> Dict[str, Any]:
-    """Basic health probe for Streamlit frontend."""
-    return {
-        "status": "ok",
-        "app_name": settings.app_name,
-        "use_mock_data": settings.use_mock_data,
-        "language": settings.travio_language,
-    }
+# NOTE: /api/system/health is registered as a bare Starlette route in
+# backend.app.main so probes bypass the FastAPI routing layer entirely.
 
 
 @router.get("/activity")
 async def activity_log(
-    activity_log=Depends(get_activity_log),
+    request: Request,
     limit: Optional[int] = Query(default=None, ge=1),
-) -> List[Dict[str, Any]]:
-    """Return recorded activity entries."""
-    if limit is None or limit >= len(activity_log):
-        return list(activity_log)
-    return list(activity_log)[-limit:]
+) -> Response:
+    """Return recorded activity entries.
+
+    Entries are stored pre-serialized as JSON bytes, so the response body
+    is assembled by joining them rather than re-encoding Python dicts.
+    Limited reads walk only the newest ``limit`` entries from the tail of
+    the ring buffer instead of copying the whole log first. The recorder
+    is read straight off ``app.state`` — a plain attribute lookup beats a
+    dependency-solver pass for a container fetch.
+    """
+    recorder = request.app.state.activity_log  # type: ignore[attr-defined]
+    if limit is None:
+        entries = list(recorder)
+    else:
+        entries = list(islice(reversed(recorder), limit))[::-1]
+    body = b"[" + b",".join(entries) + b"]"
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/activity/export")
+async def export_activity(request: Request) -> StreamingResponse:
+    """Stream the activity log as newline-delimited JSON.
+
+    Entries are emitted one at a time from the stored bytes, so exporting
+    a full ring buffer never materializes one giant response body.
+    """
+    entries = list(request.app.state.activity_log)  # type: ignore[attr-defined]
+    return StreamingResponse(
+        (entry + b"\n" for entry in entries),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.delete("/activity")
-async def clear_activity(
-    activity_log=Depends(get_activity_log),
-) -> Dict[str, str]:
+async def clear_activity(request: Request) -> Dict[str, str]:
     """Purge recorded activity."""
-    activity_log.clear()
+    request.app.state.activity_log.clear()  # type: ignore[attr-defined]
     return {"status": "cleared"}
-
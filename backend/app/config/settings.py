@@ -8,7 +8,15 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Runtime configuration loaded from environment variables."""
+    """Runtime configuration loaded from environment variables.
+
+    Stays on pydantic-settings deliberately: parsing runs once per process
+    behind the get_settings() cache, pydantic is already a hard dependency
+    via FastAPI, and the env-file/alias/validation behaviour below is
+    exactly what a hand-rolled parser would have to reimplement. Swapping
+    the class for a lighter struct library would shave import time only,
+    at the cost of a new dependency.
+    """
 
     travio_id: int = Field(..., alias="TRAVIO_ID")
     travio_key: str = Field(..., alias="TRAVIO_KEY")
@@ -20,6 +28,25 @@ class Settings(BaseSettings):
     )
     use_mock_data: bool = Field(default=False, alias="USE_MOCK_DATA")
     app_name: str = Field(default="Travio Assistant Backend", alias="APP_NAME")
+    activity_log_max: int = Field(default=10_000, alias="ACTIVITY_LOG_MAX")
+    activity_batch_size: int = Field(default=100, alias="ACTIVITY_BATCH_SIZE")
+    activity_record_success: bool = Field(
+        default=True, alias="ACTIVITY_RECORD_SUCCESS"
+    )
+    activity_drop_full: bool = Field(default=False, alias="ACTIVITY_DROP_FULL")
+    travio_pool_size: int = Field(default=100, alias="TRAVIO_POOL_SIZE")
+    travio_keepalive: int = Field(default=50, alias="TRAVIO_KEEPALIVE")
+    travio_max_retries: int = Field(default=3, alias="TRAVIO_MAX_RETRIES")
+    travio_breaker_threshold: int = Field(default=5, alias="TRAVIO_BREAKER_THRESHOLD")
+    travio_breaker_reset: float = Field(default=30.0, alias="TRAVIO_BREAKER_RESET")
+    travio_booking_concurrency: int = Field(
+        default=20, alias="TRAVIO_BOOKING_CONCURRENCY"
+    )
+    travio_crm_concurrency: int = Field(default=10, alias="TRAVIO_CRM_CONCURRENCY")
+    travio_timeout_connect: float = Field(default=10.0, alias="TRAVIO_TIMEOUT_CONNECT")
+    travio_timeout_read: float = Field(default=30.0, alias="TRAVIO_TIMEOUT_READ")
+    travio_retry_base: float = Field(default=0.5, alias="TRAVIO_RETRY_BASE")
+    travio_retry_cap: float = Field(default=8.0, alias="TRAVIO_RETRY_CAP")
 
     model_config = SettingsConfigDict(
         env_file=(".env.local", ".env"), env_file_encoding="utf-8", extra="ignore"
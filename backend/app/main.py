@@ -2,32 +2,70 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Dict, List
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Dict
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+from starlette.routing import Route
 
 from backend.app.api import auth, booking, crm, quotes, system
+from backend.app.api.activity import ActivityLogMiddleware, ActivityRecorder
+from backend.app.api.deps import set_travio_client
 from backend.app.config import Settings, get_settings
-from backend.app.services.mock_client import MockTravioClient
-from backend.app.services.travio_client import TravioClient
+
+if TYPE_CHECKING:
+    from backend.app.services.mock_client import MockTravioClient
+    from backend.app.services.travio_client import TravioClient
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage application startup/shutdown routines."""
     settings: Settings = get_settings()
+    # Only import the client implementation actually in use, so mock-mode
+    # startups never pay for the real HTTP client module and vice versa.
     client: TravioClient | MockTravioClient
     if settings.use_mock_data:
+        from backend.app.services.mock_client import MockTravioClient
+
         client = MockTravioClient(settings)
     else:
+        from backend.app.services.travio_client import TravioClient
+
         client = TravioClient(settings)
-    activity_log: List[Dict[str, Any]] = []
+    activity_log: Deque[bytes] = deque(maxlen=settings.activity_log_max)
+    recorder = ActivityRecorder(
+        activity_log,
+        batch_size=settings.activity_batch_size,
+        record_success=settings.activity_record_success,
+        drop_full=settings.activity_drop_full,
+    )
+    recorder.start()
 
     app.state.settings = settings  # type: ignore[attr-defined]
     app.state.travio_client = client  # type: ignore[attr-defined]
-    app.state.activity_log = activity_log  # type: ignore[attr-defined]
+    set_travio_client(client)
+    app.state.activity_log = recorder  # type: ignore[attr-defined]
+
+    # Health probes are answered from these precomputed bytes; the payload
+    # only changes when settings change, i.e. at startup.
+    health_body = orjson.dumps(
+        {
+            "status": "ok",
+            "app_name": settings.app_name,
+            "use_mock_data": settings.use_mock_data,
+            "language": settings.travio_language,
+        }
+    )
+    app.state.health_body = health_body  # type: ignore[attr-defined]
+    app.state.health_etag = hashlib.blake2b(  # type: ignore[attr-defined]
+        health_body, digest_size=8
+    ).hexdigest()
 
     logger.info(
         "Starting Travio assistant backend (mock mode = {mock})",
@@ -36,6 +74,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
+        await recorder.stop()
         await client.close()
         logger.info("Travio assistant backend shutdown complete")
 
@@ -44,9 +83,37 @@ app = FastAPI(
     title="Travio Assistant Backend",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
+app.add_middleware(ActivityLogMiddleware)
+
+
+async def _health(request: Request) -> Response:
+    """Basic health probe for Streamlit frontend.
+
+    Served from JSON bytes precomputed at startup with a strong ETag, so
+    frequent pollers cost neither dependency resolution nor serialization
+    and matching If-None-Match probes short-circuit to 304. Registered as
+    a bare Starlette route (below) rather than through FastAPI, skipping
+    the dependency solver and APIRoute machinery per probe; it therefore
+    does not appear in the OpenAPI schema.
+    """
+    etag = request.app.state.health_etag  # type: ignore[attr-defined]
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=request.app.state.health_body,  # type: ignore[attr-defined]
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=5"},
+    )
+
+
+app.router.routes.insert(
+    0, Route("/api/system/health", _health, methods=["GET"])
+)
+
 app.include_router(system.router)
 app.include_router(auth.router)
 app.include_router(crm.router)
@@ -1,5 +1,6 @@
 """Pydantic models for booking operations."""
 
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -21,30 +22,9 @@ class BookingSearchRequest(BaseModel):
     cart: Optional[str] = None
     client_country: Optional[str] = None
 
-    def to_payload(self) -> Dict[str, Any]:
-        payload = {
-            "type": self.type,
-            "from": self.from_date,
-            "to": self.to_date,
-            "occupancy": self.occupancy,
-        }
-        if self.geo is not None:
-            payload["geo"] = self.geo
-        if self.ids is not None:
-            payload["ids"] = self.ids
-        if self.codes is not None:
-            payload["codes"] = self.codes
-        if self.per_page is not None:
-            payload["per_page"] = self.per_page
-        if self.return_filters:
-            payload["return_filters"] = self.return_filters
-        if self.sort_by:
-            payload["sort_by"] = self.sort_by
-        if self.cart:
-            payload["cart"] = self.cart
-        if self.client_country:
-            payload["client_country"] = self.client_country
-        return payload
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
 
 
 class BookingResultsRequest(BaseModel):
@@ -56,15 +36,9 @@ class BookingResultsRequest(BaseModel):
     filters: Optional[List[Dict[str, Any]]] = None
     sort_by: Optional[List[Dict[str, Any]]] = None
 
-    def to_payload(self) -> Dict[str, Any]:
-        payload = {"search_id": self.search_id, "page": self.page}
-        if self.per_page is not None:
-            payload["per_page"] = self.per_page
-        if self.filters:
-            payload["filters"] = self.filters
-        if self.sort_by:
-            payload["sort_by"] = self.sort_by
-        return payload
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
 
 
 class BookingPicksRequest(BaseModel):
@@ -75,15 +49,9 @@ class BookingPicksRequest(BaseModel):
     picks: List[Dict[str, Any]]
     per_page: Optional[int] = None
 
-    def to_payload(self) -> Dict[str, Any]:
-        payload = {
-            "search_id": self.search_id,
-            "step": self.step,
-            "picks": self.picks,
-        }
-        if self.per_page is not None:
-            payload["per_page"] = self.per_page
-        return payload
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
 
 
 class CartMutationRequest(BaseModel):
@@ -91,8 +59,9 @@ class CartMutationRequest(BaseModel):
 
     search_id: str
 
-    def to_payload(self) -> Dict[str, Any]:
-        return {"search_id": self.search_id}
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
 
 
 class PlaceReservationRequest(BaseModel):
@@ -105,25 +74,11 @@ class PlaceReservationRequest(BaseModel):
     description: Optional[str] = None
     reference: Optional[str] = None
     payment_link: Optional[bool] = None
-    client_id: Optional[int] = None
-
-    def to_payload(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"pax": self.pax}
-        if self.status is not None:
-            payload["status"] = self.status
-        if self.due is not None:
-            payload["due"] = self.due
-        if self.notes:
-            payload["notes"] = self.notes
-        if self.description:
-            payload["description"] = self.description
-        if self.reference:
-            payload["reference"] = self.reference
-        if self.payment_link is not None:
-            payload["payment_link"] = self.payment_link
-        if self.client_id is not None:
-            payload["client"] = self.client_id
-        return payload
+    client_id: Optional[int] = Field(default=None, serialization_alias="client")
+
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
 
 
 class QuoteDeliveryRequest(BaseModel):
@@ -133,10 +88,6 @@ class QuoteDeliveryRequest(BaseModel):
     archive: Optional[bool] = None
     send: Optional[bool] = None
 
-    def to_payload(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"template": self.template}
-        if self.archive is not None:
-            payload["archive"] = self.archive
-        if self.send is not None:
-            payload["send"] = self.send
-        return payload
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
@@ -1,10 +1,74 @@
 """Pydantic models for CRM-related API interactions."""
 
-import json
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, Field
 
+# UI filter key -> Travio filter field, with None operator meaning "detect"
+# (numeric codes match by id equality, anything else falls back to like).
+_FILTER_SPECS = (
+    ("filter[email]", "contacts.email", "like"),
+    ("filter[surname]", "surname", "like"),
+    ("filter[code]", "id", None),
+)
+
+
+def _build_params(
+    filters: Dict[str, Any],
+    page: Optional[int],
+    per_page: Optional[int],
+    unfold: Optional[str],
+) -> Dict[str, Any]:
+    """Translate normalized search inputs into Travio query parameters."""
+    params: Dict[str, Any] = {}
+    travio_filters: List[Dict[str, Any]] = []
+
+    for key, field, operator in _FILTER_SPECS:
+        value = filters.get(key)
+        if not value:
+            continue
+        if operator is None:
+            operator = "=" if str(value).isdigit() else "like"
+        if operator == "like":
+            value = f"%{value}%"
+        travio_filters.append({"field": field, "operator": operator, "value": value})
+
+    if travio_filters:
+        params["filters"] = orjson.dumps(travio_filters).decode()
+    elif filters:
+        params["filters"] = "[]"
+
+    unfold_parts: List[str] = []
+    phone = filters.get("filter[phone]")
+    if phone:
+        params["_phone_filter"] = phone
+        unfold_parts.append("contacts")
+
+    if page is not None:
+        params["page"] = page
+    if per_page is not None:
+        params["per_page"] = per_page
+    if unfold:
+        unfold_parts.append(unfold)
+    elif travio_filters and not unfold_parts:
+        unfold_parts.append("contacts")
+    if unfold_parts:
+        params["unfold"] = ",".join(unfold_parts)
+    return params
+
+
+@lru_cache(maxsize=512)
+def _cached_params(
+    filters_key: Tuple[Tuple[str, Any], ...],
+    page: Optional[int],
+    per_page: Optional[int],
+    unfold: Optional[str],
+) -> Dict[str, Any]:
+    """Memoized param translation for repeat queries (typeahead, paging)."""
+    return _build_params(dict(filters_key), page, per_page, unfold)
+
 
 class CRMSearchRequest(BaseModel):
     """Request body for CRM search operations."""
@@ -15,52 +79,23 @@ class CRMSearchRequest(BaseModel):
     unfold: Optional[str] = None
 
     def to_params(self) -> Dict[str, Any]:
-        """Serialize request into Travio query string parameters."""
-        params: Dict[str, Any] = {}
-        filters: Dict[str, Any] = self.filters or {}
-        travio_filters = []
-
-        email = filters.get("filter[email]")
-        if email:
-            travio_filters.append(
-                {"field": "contacts.email", "operator": "like", "value": f"%{email}%"}
-            )
+        """Serialize request into Travio query string parameters.
 
-        surname = filters.get("filter[surname]")
-        if surname:
-            travio_filters.append(
-                {"field": "surname", "operator": "like", "value": f"%{surname}%"}
-            )
-
-        code = filters.get("filter[code]")
-        if code:
-            operator = "=" if str(code).isdigit() else "like"
-            value = code if operator == "=" else f"%{code}%"
-            travio_filters.append({"field": "id", "operator": operator, "value": value})
-
-        if travio_filters:
-            params["filters"] = json.dumps(travio_filters)
-        elif filters:
-            params["filters"] = "[]"
-
-        phone = filters.get("filter[phone]")
-        if phone:
-            params["_phone_filter"] = phone
-            params.setdefault("unfold", "contacts")
-
-        if self.page is not None:
-            params["page"] = self.page
-        if self.per_page is not None:
-            params["per_page"] = self.per_page
-        if self.unfold:
-            params["unfold"] = (
-                f"{params['unfold']},{self.unfold}"
-                if "unfold" in params and params["unfold"]
-                else self.unfold
+        Repeat queries hit an LRU cache keyed on the canonicalized filter
+        items; a copy is returned because callers pop internal keys from
+        the result. Unhashable filter values fall back to the uncached
+        translation.
+        """
+        filters: Dict[str, Any] = self.filters or {}
+        try:
+            # Hashing the key happens inside lru_cache, so unhashable
+            # filter values surface here as TypeError.
+            cached = _cached_params(
+                tuple(sorted(filters.items())), self.page, self.per_page, self.unfold
             )
-        elif travio_filters:
-            params.setdefault("unfold", "contacts")
-        return params
+        except TypeError:
+            return _build_params(filters, self.page, self.per_page, self.unfold)
+        return dict(cached)
 
 
 class CRMClientPayload(BaseModel):
@@ -2,22 +2,52 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
-import random
-import string
-from datetime import datetime, timedelta
+import secrets
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 from math import ceil
 from typing import Any, Dict, List, Optional
 
+import orjson
 from loguru import logger
 
 from backend.app.config import Settings
 
 
 def _random_id(prefix: str) -> str:
-    token = "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    return f"{prefix}_{token}"
+    return f"{prefix}_{secrets.token_hex(3)}"
+
+
+# Static demo tables, built once at import instead of per instance/call.
+_MASTER_DATA_CATEGORIES = (
+    {"id": 1, "code": "CLI", "name": "Clienti privati"},
+    {"id": 2, "code": "CORP", "name": "Clienti corporate"},
+    {"id": 3, "code": "SUP", "name": "Fornitori"},
+)
+
+_SAMPLE_ITEM_NAME = "Mock Resort"
+_SAMPLE_BOOKING_ITEM = {
+    "idx": 0,
+    "price": 420.0,
+    "currency": "EUR",
+    "supplier": "Mock Supplier",
+    "board": "BB",
+}
+
+
+@dataclass(slots=True)
+class _Reservation:
+    """Slotted storage for mock reservations (cheaper than a 9-key dict)."""
+
+    id: int
+    cart_id: str
+    status: int
+    pax: List[Dict[str, Any]]
+    reference: Optional[str]
+    description: Optional[str]
+    payment_link: str
+    created_at: datetime
+    due: str
 
 
 class MockTravioClient:
@@ -65,18 +95,48 @@ class MockTravioClient:
             },
         ]
         self._next_client_id = 103
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._surname_lower: Dict[int, str] = {}
+        self._emails_lower: Dict[int, List[str]] = {}
+        self._phones_joined: Dict[int, str] = {}
+        self._rebuild_indices()
         self._search_results: Dict[str, Dict[str, Any]] = {}
         self._carts: Dict[str, Dict[str, Any]] = {}
-        self._reservations: Dict[str, Dict[str, Any]] = {}
-        self._master_data_categories: List[Dict[str, Any]] = [
-            {"id": 1, "code": "CLI", "name": "Clienti privati"},
-            {"id": 2, "code": "CORP", "name": "Clienti corporate"},
-            {"id": 3, "code": "SUP", "name": "Fornitori"},
+        self._reservations: Dict[str, _Reservation] = {}
+        self._next_reservation_id = 1000
+
+    def _index_client(self, client: Dict[str, Any]) -> None:
+        """Record lookup/search caches for one client.
+
+        Lowercased surname/email strings and joined phone numbers are
+        computed once per mutation instead of on every search comparison;
+        phones are newline-joined so substring checks cannot straddle two
+        numbers.
+        """
+        client_id = client["id"]
+        self._by_id[client_id] = client
+        self._surname_lower[client_id] = (
+            client.get("lastname") or client.get("surname") or ""
+        ).lower()
+        contacts = client.get("contacts") or []
+        self._emails_lower[client_id] = [
+            mail.lower() for contact in contacts for mail in contact.get("email") or []
         ]
+        self._phones_joined[client_id] = "\n".join(
+            phone for contact in contacts for phone in contact.get("phone") or []
+        )
+
+    def _rebuild_indices(self) -> None:
+        """Rebuild all client search caches from scratch."""
+        self._by_id = {}
+        self._surname_lower = {}
+        self._emails_lower = {}
+        self._phones_joined = {}
+        for client in self._clients:
+            self._index_client(client)
 
     async def close(self) -> None:
         """Mock close to align with TravioClient interface."""
-        await asyncio.sleep(0)
 
     async def authenticate(self) -> str:
         """Return mock token."""
@@ -105,18 +165,45 @@ class MockTravioClient:
         }
 
     # --- CRM endpoints ---
+    def _match_email(self, client_id: int, operator: str, needle: str) -> bool:
+        emails = self._emails_lower.get(client_id, [])
+        if operator == "like":
+            return any(needle in email for email in emails)
+        return needle in emails
+
+    def _match_surname(self, client_id: int, operator: str, needle: str) -> bool:
+        surname = self._surname_lower.get(client_id, "")
+        if operator == "like":
+            return needle in surname
+        return surname == needle
+
+    def _match_id(self, client_id: int, operator: str, needle: str) -> bool:
+        return needle in str(client_id).lower()
+
+    # Field -> matcher dispatch, replacing a per-item string-comparison chain.
+    _MATCHERS = {
+        "contacts.email": _match_email,
+        "surname": _match_surname,
+        "id": _match_id,
+    }
+
     async def search_clients(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Filter mock clients by simple attributes."""
-        results = list(self._clients)
         filters_raw = params.get("filters")
         filter_defs: List[Dict[str, Any]] = []
         if isinstance(filters_raw, str) and filters_raw:
             try:
-                filter_defs = json.loads(filters_raw)
-            except json.JSONDecodeError:
+                filter_defs = orjson.loads(filters_raw)
+            except orjson.JSONDecodeError:
                 filter_defs = []
 
-        def matches(item: Dict[str, Any], flt: Dict[str, Any]) -> bool:
+        # Parse filters up front: the operator/needle strings are normalized
+        # once per filter (not once per candidate), exact id filters narrow
+        # the candidate base via the index, and everything else resolves to a
+        # matcher applied in one fused pass below.
+        base: List[Dict[str, Any]] = self._clients
+        predicates: List[tuple] = []
+        for flt in filter_defs:
             field = flt.get("field")
             operator = (flt.get("operator") or "like").lower()
             value = str(flt.get("value", ""))
@@ -124,43 +211,33 @@ class MockTravioClient:
                 needle = value.strip("%").lower()
             else:
                 needle = value.lower()
-
-            if field == "contacts.email":
-                contacts = item.get("contacts", [])
-                emails = [
-                    mail.lower()
-                    for contact in contacts
-                    for mail in contact.get("email") or []
-                ]
-                if operator == "like":
-                    return any(needle in email for email in emails)
-                return value.lower() in emails
-            if field == "surname":
-                surname = item.get("lastname") or item.get("surname", "")
-                if operator == "like":
-                    return needle in surname.lower()
-                return surname.lower() == needle
-            if field == "id":
-                target = str(item.get("id", "")).lower()
-                if operator == "like":
-                    return needle in target
-                return target == needle
-            return True
-
-        for flt in filter_defs:
-            results = [item for item in results if matches(item, flt)]
+            if field == "id" and operator != "like":
+                try:
+                    client = self._by_id.get(int(value))
+                except ValueError:
+                    client = None
+                if client is None or (base is not self._clients and client not in base):
+                    base = []
+                else:
+                    base = [client]
+                continue
+            matcher = self._MATCHERS.get(field)
+            if matcher is not None:
+                predicates.append((matcher, operator, needle))
 
         phone_filter = params.get("_phone_filter")
-        if phone_filter:
+        if predicates or phone_filter:
             results = [
                 item
-                for item in results
-                if any(
-                    phone_filter in phone
-                    for contact in item.get("contacts", [])
-                    for phone in (contact.get("phone") or [])
+                for item in base
+                if all(m(self, item["id"], o, n) for m, o, n in predicates)
+                and (
+                    not phone_filter
+                    or phone_filter in self._phones_joined.get(item["id"], "")
                 )
             ]
+        else:
+            results = base
 
         page = int(params.get("page", 1) or 1)
         per_page = int(params.get("per_page", 20) or 20)
@@ -182,10 +259,10 @@ class MockTravioClient:
 
     async def get_client(self, client_id: int) -> Dict[str, Any]:
         """Retrieve mock client."""
-        for client in self._clients:
-            if client["id"] == client_id:
-                return client
-        raise ValueError("Client not found")
+        client = self._by_id.get(client_id)
+        if client is None:
+            raise ValueError("Client not found")
+        return client
 
     async def create_client(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create mock client."""
@@ -223,49 +300,50 @@ class MockTravioClient:
             else:
                 payload.pop("categories", None)
         self._clients.append(payload)
+        self._index_client(payload)
         logger.debug("Mock client created: {client}", client=payload)
         return payload
 
     async def update_client(self, client_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Update mock client."""
-        for idx, client in enumerate(self._clients):
-            if client["id"] == client_id:
-                updated = client | payload
-                email = updated.get("email")
-                phone = updated.get("phone")
-                if email or phone:
-                    updated["contacts"] = [
-                        {
-                            "name": "Primary",
-                            "email": [email] if email else [],
-                            "phone": [phone] if phone else [],
-                            "fax": [],
-                        }
-                    ]
-                if email is not None:
-                    updated["email"] = email
-                if phone is not None:
-                    updated["phone"] = phone
-                if "categories" in payload:
-                    categories = [
-                        cat for cat in payload.get("categories", []) if isinstance(cat, int)
-                    ]
-                    if categories:
-                        updated["categories"] = categories
-                    else:
-                        updated.pop("categories", None)
-                self._clients[idx] = updated
-                return updated
-        raise ValueError("Client not found")
+        client = self._by_id.get(client_id)
+        if client is None:
+            raise ValueError("Client not found")
+        # Mutate the stored dict in place (self._clients holds the same
+        # object) and only rebuild the contacts list when the update
+        # actually touches email or phone.
+        client.update(payload)
+        if "email" in payload or "phone" in payload:
+            email = client.get("email")
+            phone = client.get("phone")
+            if email or phone:
+                client["contacts"] = [
+                    {
+                        "name": "Primary",
+                        "email": [email] if email else [],
+                        "phone": [phone] if phone else [],
+                        "fax": [],
+                    }
+                ]
+        if "categories" in payload:
+            categories = [
+                cat for cat in payload.get("categories", []) if isinstance(cat, int)
+            ]
+            if categories:
+                client["categories"] = categories
+            else:
+                client.pop("categories", None)
+        self._index_client(client)
+        return client
 
     async def list_master_data_categories(
         self, *, page: int = 1, per_page: int = 200
     ) -> Dict[str, Any]:
         """Return mock master-data categories."""
-        total = len(self._master_data_categories)
+        total = len(_MASTER_DATA_CATEGORIES)
         start = (page - 1) * per_page
         end = start + per_page if per_page else None
-        items = self._master_data_categories[start:end]
+        items = _MASTER_DATA_CATEGORIES[start:end]
         return {
             "items": items,
             "list": items,
@@ -276,6 +354,21 @@ class MockTravioClient:
             "pages": ceil(total / per_page) if per_page else 1,
         }
 
+    async def list_all_master_data_categories(
+        self, *, per_page: int = 200
+    ) -> Dict[str, Any]:
+        """Return every mock master-data category in one envelope."""
+        total = len(_MASTER_DATA_CATEGORIES)
+        return {
+            "items": _MASTER_DATA_CATEGORIES,
+            "list": _MASTER_DATA_CATEGORIES,
+            "total": total,
+            "tot": total,
+            "page": 1,
+            "per_page": total,
+            "pages": 1,
+        }
+
     # --- Booking endpoints ---
 
     async def booking_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -284,15 +377,12 @@ class MockTravioClient:
         check_in = payload.get("from")
         check_out = payload.get("to")
         service_type = payload.get("type", "hotels")
-        sample_item = {
-            "id": 501,
-            "name": "Mock Resort",
-            "price": 420.0,
-            "currency": "EUR",
-            "board": "BB",
-            "supplier": "Mock Supplier",
-            "cancellation": "Free cancellation up to 48h",
-        }
+        # Only the per-call fields are built here; the static item fields
+        # are spliced in from the module-level template. Splicing at the
+        # dict level (not into pre-serialized JSON bytes) matters: the
+        # dates/type values come from the request payload, so substituting
+        # them into a serialized template would skip JSON escaping, and
+        # booking_results/cart_add need the parsed dict anyway.
         groups = [
             {
                 "group": 0,
@@ -300,12 +390,8 @@ class MockTravioClient:
                 "pick_type": "one",
                 "items": [
                     {
-                        "idx": 0,
-                        "title": f"{sample_item['name']} ({service_type})",
-                        "price": sample_item["price"],
-                        "currency": sample_item["currency"],
-                        "supplier": sample_item["supplier"],
-                        "board": sample_item["board"],
+                        **_SAMPLE_BOOKING_ITEM,
+                        "title": f"{_SAMPLE_ITEM_NAME} ({service_type})",
                         "dates": [{"idx": 0, "from": check_in, "to": check_out}],
                     }
                 ],
@@ -361,21 +447,25 @@ class MockTravioClient:
 
     async def place_reservation(self, cart_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create mock reservation."""
-        reservation_id = random.randint(1000, 9999)
-        reservation = {
-            "id": reservation_id,
-            "cart_id": cart_id,
-            "status": payload.get("status", 0),
-            "pax": payload.get("pax", []),
-            "reference": payload.get("reference"),
-            "description": payload.get("description"),
-            "payment_link": f"https://payments.example.com/{reservation_id}",
-            "created_at": datetime.utcnow().isoformat(),
-            "due": payload.get("due")
-            or (datetime.utcnow() + timedelta(days=3)).strftime("%Y-%m-%d 12:00:00"),
-        }
+        reservation_id = self._next_reservation_id
+        self._next_reservation_id += 1
+        now = datetime.now(timezone.utc)
+        reservation = _Reservation(
+            id=reservation_id,
+            cart_id=cart_id,
+            status=payload.get("status", 0),
+            pax=payload.get("pax", []),
+            reference=payload.get("reference"),
+            description=payload.get("description"),
+            payment_link=f"https://payments.example.com/{reservation_id}",
+            # orjson (the app-wide response encoder) renders datetimes to
+            # ISO-8601 natively, so no manual isoformat() call is needed.
+            created_at=now,
+            due=payload.get("due")
+            or f"{(now + timedelta(days=3)).date().isoformat()} 12:00:00",
+        )
         self._reservations[str(reservation_id)] = reservation
-        return reservation
+        return asdict(reservation)
 
     async def send_quote(self, reservation_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Return mock send quote response."""
@@ -3,15 +3,40 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
-from datetime import datetime, timedelta, timezone
+import random
+import time
+from contextlib import asynccontextmanager, nullcontext
+from functools import partial
 from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
+import orjson
 from loguru import logger
 
 from backend.app.config import Settings
 
+# Transient outcomes worth retrying; permanent 4xx fail fast.
+_RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+_RETRYABLE_EXC = (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+
+# Bound str.format builders for the parameterized endpoint paths. Constant
+# URLs live in the _ep_* partials; these cover the paths that embed an id,
+# skipping the per-call f-string assembly on fan-out-heavy CRM lookups.
+_U_CLIENT = "/rest/master-data/{}".format
+_U_CART = "/booking/cart/{}".format
+_U_PLACE = "/booking/place/{}".format
+_U_QUOTE = "/tools/print/reservation/{}".format
+
+# Error bodies only ever end up in exceptions and log lines, so cap what
+# gets decoded: a pathological multi-megabyte upstream error should not
+# balloon the log pipeline or the exception payload.
+_ERROR_BODY_MAX = 4096
+
+
+def _error_body(response: httpx.Response) -> str:
+    """Decode at most the first few KB of an error response body."""
+    return response.content[:_ERROR_BODY_MAX].decode("utf-8", "replace")
+
 
 class TravioAPIError(Exception):
     """Raised when Travio API returns an unexpected response."""
@@ -19,25 +44,168 @@ class TravioAPIError(Exception):
     def __init__(self, status_code: int, payload: Any):
         self.status_code = status_code
         self.payload = payload
+        # Precomputed so error handlers can append upstream detail with a
+        # plain attribute load instead of re-checking the payload type.
+        self.detail_suffix = f": {payload}" if isinstance(payload, str) else ""
         super().__init__(f"Travio API request failed with status {status_code}")
 
 
+class _Breaker:
+    """Minimal circuit breaker tracking consecutive Travio failures.
+
+    Trips open after ``threshold`` consecutive 5xx/network failures and
+    short-circuits calls for ``reset_timeout`` seconds; after the window a
+    probe request is let through (half-open) and a success closes the
+    circuit again. Client 4xx responses never count — they signal caller
+    mistakes, not service health.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        self._threshold = threshold
+        self._reset = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        return time.monotonic() - self._opened_at >= self._reset
+
+    def on_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def on_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+
+
 class TravioClient:
     """Async client handling auth, retries, and request routing."""
 
     def __init__(self, settings: Settings):
         self._settings = settings
         self._token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
-        self._client = httpx.AsyncClient(
-            base_url=str(settings.travio_base_url),
-            timeout=httpx.Timeout(10.0, read=30.0),
+        # Monotonic deadline (seconds): cheaper to compare than aware
+        # datetimes on every call and immune to wall-clock jumps.
+        self._token_deadline: float = 0.0
+        # One persistent client: HTTP/2 multiplexes concurrent API calls
+        # over a single TLS session, and the pool is sized explicitly so
+        # endpoint fan-out never serializes on handshakes.
+        self._default_timeout = httpx.Timeout(
+            settings.travio_timeout_connect, read=settings.travio_timeout_read
         )
+        # Per-endpoint overrides: quick interactive calls fail fast, and
+        # booking searches get room above their observed worst case.
+        self._endpoint_timeouts = (
+            ("/auth", httpx.Timeout(5.0, read=5.0)),
+            ("/profile", httpx.Timeout(5.0, read=5.0)),
+            ("/booking/search", httpx.Timeout(10.0, read=60.0)),
+        )
+        # Created lazily on first await and bound to the running loop;
+        # short-lived loops (tests, scripts) otherwise crash with "Event
+        # loop is closed" when pooled connections outlive their loop.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._lock = asyncio.Lock()
+        self._refresh_task: Optional["asyncio.Task[str]"] = None
+        self._watchdog_task: Optional["asyncio.Task[None]"] = None
+        self._max_retries = settings.travio_max_retries
+        self._retry_base = settings.travio_retry_base
+        self._retry_cap = settings.travio_retry_cap
+        self._breaker = _Breaker(
+            settings.travio_breaker_threshold, settings.travio_breaker_reset
+        )
+        self._inflight: Dict[Any, "asyncio.Future[Dict[str, Any]]"] = {}
+        # Bulkheads: a storm on one endpoint class cannot exhaust the
+        # connection pool for the others.
+        self._sem_booking = asyncio.Semaphore(settings.travio_booking_concurrency)
+        self._sem_crm = asyncio.Semaphore(settings.travio_crm_concurrency)
+        # Static header template; the Authorization variant is rebuilt only
+        # when the token rotates, so _do_request never assembles headers
+        # from scratch per call.
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "X-Lang": settings.travio_language,
+            # Large booking payloads are bandwidth-bound uncompressed;
+            # httpx decompresses transparently (brotli via the dependency).
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+        self._auth_headers: Dict[str, str] = dict(self._base_headers)
+        # Bound partials for constant method/URL endpoints: the public
+        # methods become one attribute load plus an await, with the string
+        # literals and bulkhead binding resolved once here.
+        self._ep_profile = partial(self._request, "GET", "/profile")
+        self._ep_login = partial(self._request, "POST", "/login")
+        self._ep_search = partial(
+            self._request, "GET", "/rest/master-data", bulkhead=self._sem_crm
+        )
+        self._ep_create_client = partial(
+            self._request, "POST", "/rest/master-data", bulkhead=self._sem_crm
+        )
+        self._ep_categories = partial(
+            self._request, "GET", "/rest/master-data-categories", bulkhead=self._sem_crm
+        )
+        self._ep_booking_search = partial(
+            self._request, "POST", "/booking/search", bulkhead=self._sem_booking
+        )
+        self._ep_booking_results = partial(
+            self._request, "POST", "/booking/results", bulkhead=self._sem_booking
+        )
+        self._ep_booking_picks = partial(
+            self._request, "POST", "/booking/picks", bulkhead=self._sem_booking
+        )
+        self._ep_cart_add = partial(
+            self._request, "PUT", "/booking/cart", bulkhead=self._sem_booking
+        )
+        self._ep_cart_remove = partial(
+            self._request, "DELETE", "/booking/cart", bulkhead=self._sem_booking
+        )
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client bound to the current event loop.
+
+        One persistent client per loop: HTTP/2 multiplexes concurrent API
+        calls over a single TLS session, and the pool is sized explicitly
+        so endpoint fan-out never serializes on handshakes. If the loop
+        changed (a previous one was torn down), the stale client is
+        dropped — its connections belong to the dead loop — and loop-bound
+        background tasks are forgotten so nothing awaits across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                logger.debug("Event loop changed; rebuilding Travio HTTP client")
+                self._refresh_task = None
+                self._watchdog_task = None
+                self._inflight.clear()
+            self._client = httpx.AsyncClient(
+                base_url=str(self._settings.travio_base_url),
+                timeout=self._default_timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self._settings.travio_pool_size,
+                    max_keepalive_connections=self._settings.travio_keepalive,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
-        await self._client.aclose()
+        for task in (self._watchdog_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     @asynccontextmanager
     async def lifespan(self) -> AsyncIterator["TravioClient"]:
@@ -48,38 +216,102 @@ class TravioClient:
             await self.close()
 
     async def authenticate(self) -> str:
-        """Retrieve bearer token using id/key credentials."""
+        """Retrieve bearer token using id/key credentials.
+
+        The lock only guards the check-and-claim of the refresh: the
+        ``/auth`` round-trip itself runs in a single shared task, so
+        concurrent callers await the same in-flight refresh instead of
+        serializing behind the lock for the whole HTTP call.
+        """
         async with self._lock:
-            if self._token and self._token_expiry and self._token_expiry > datetime.now(
-                timezone.utc
-            ):
+            if self._token and time.monotonic() < self._token_deadline:
                 return self._token
+            if self._refresh_task is None:
+                self._refresh_task = asyncio.create_task(self._do_refresh())
+            task = self._refresh_task
+        return await task
 
+    async def _do_refresh(self) -> str:
+        """Perform the actual ``/auth`` call and store the new token."""
+        try:
             payload = {"id": self._settings.travio_id, "key": self._settings.travio_key}
             logger.info("Requesting Travio auth token")
-            response = await self._client.post("/auth", json=payload)
+            client = await self._get_client()
+            response = await client.post(
+                "/auth", json=payload, timeout=self._timeout_for("/auth")
+            )
             if response.status_code != 200:
-                raise TravioAPIError(response.status_code, response.text)
+                raise TravioAPIError(response.status_code, _error_body(response))
 
-            data = response.json()
+            data = orjson.loads(response.content)
             token = data.get("token")
             expires_in = data.get("expires_in", 3600)
             if not token:
                 raise TravioAPIError(response.status_code, data)
 
-            self._token = token
-            self._token_expiry = datetime.now(timezone.utc) + timedelta(
-                seconds=int(expires_in * 0.9)
-            )
+            self._set_token(token, int(expires_in * 0.9))
+            self._schedule_watchdog()
             return token
-
-    async def _ensure_token(self) -> str:
-        """Ensure we have a valid token before issuing API calls."""
-        if not self._token or not self._token_expiry or self._token_expiry <= datetime.now(
-            timezone.utc
-        ):
-            return await self.authenticate()
-        return self._token
+        finally:
+            self._refresh_task = None
+
+    def _schedule_watchdog(self) -> None:
+        """Start the proactive-refresh task if it is not already running."""
+        if self._watchdog_task is None or self._watchdog_task.done():
+            self._watchdog_task = asyncio.create_task(self._refresh_watchdog())
+
+    async def _refresh_watchdog(self) -> None:
+        """Rotate the token ~60s before its deadline.
+
+        Keeps the /auth round-trip off the request critical path in steady
+        state; the inline check in _do_request remains as the lazy
+        fallback. Bails out for
+        very short-lived tokens or on refresh failure, leaving the next
+        request to refresh lazily.
+        """
+        while True:
+            delay = self._token_deadline - time.monotonic() - 60.0
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+            async with self._lock:
+                if self._refresh_task is None:
+                    self._refresh_task = asyncio.create_task(self._do_refresh())
+                task = self._refresh_task
+            try:
+                await task
+            except Exception:
+                logger.warning("Proactive token refresh failed; falling back to lazy refresh")
+                return
+
+    def _set_token(self, token: str, lifetime_seconds: Optional[int]) -> None:
+        """Store a rotated token and rebuild the cached auth headers.
+
+        A missing lifetime leaves the deadline at zero, so the next call
+        refreshes via credentials — matching the old None-expiry handling.
+        """
+        self._token = token
+        if lifetime_seconds is not None:
+            self._token_deadline = time.monotonic() + lifetime_seconds
+        else:
+            self._token_deadline = 0.0
+        self._auth_headers = self._base_headers | {"Authorization": f"Bearer {token}"}
+
+    def _timeout_for(self, url: str) -> httpx.Timeout:
+        """Resolve the timeout for a URL, preferring per-endpoint overrides."""
+        for prefix, timeout in self._endpoint_timeouts:
+            if url.startswith(prefix):
+                return timeout
+        return self._default_timeout
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Compute the next backoff: Retry-After if sent, else full jitter."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self._retry_cap)
+            except ValueError:
+                pass
+        return min(self._retry_cap, self._retry_base * 2**attempt) * random.random()
 
     async def _request(
         self,
@@ -89,72 +321,179 @@ class TravioClient:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        bulkhead: Optional[asyncio.Semaphore] = None,
     ) -> Dict[str, Any]:
-        """Perform authorized Travio API requests."""
-        token = await self._ensure_token()
-        request_headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "X-Lang": self._settings.travio_language,
-        }
-        if headers:
-            request_headers.update(headers)
+        """Perform authorized Travio API requests.
+
+        Identical in-flight GETs are coalesced: concurrent callers for the
+        same URL/params share one round-trip through a future instead of
+        each hitting Travio. Mutating methods are never coalesced. The
+        optional ``bulkhead`` semaphore caps concurrency per endpoint
+        class so one workload cannot starve the rest of the pool.
+        """
+        if method != "GET" or headers is not None:
+            return await self._do_request(
+                method, url, headers=headers, params=params, json=json,
+                bulkhead=bulkhead,
+            )
+        try:
+            key = (url, tuple(sorted((params or {}).items())))
+            # Probe inside the guard: sorted() only compares the (string)
+            # keys, so an unhashable *value* raises TypeError here, at the
+            # dict lookup's hash(key) — not at tuple construction.
+            existing = self._inflight.get(key)
+        except TypeError:
+            return await self._do_request(
+                method, url, params=params, json=json, bulkhead=bulkhead
+            )
+        if existing is not None:
+            # Shield so one waiter's cancellation cannot cancel the shared
+            # request out from under the others.
+            return await asyncio.shield(existing)
+        future: "asyncio.Future[Dict[str, Any]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            result = await self._do_request(
+                method, url, params=params, json=json, bulkhead=bulkhead
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when there are no waiters
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
 
-        logger.debug("Travio request {method} {url}", method=method, url=url)
-        response = await self._client.request(
-            method, url, headers=request_headers, params=params, json=json
+    async def _do_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        bulkhead: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Any]:
+        """Issue one authorized request (auth, breaker, retries)."""
+        # Token fast path inlined: one float compare in the common case,
+        # no extra coroutine frame. authenticate() re-checks under its
+        # lock on the miss.
+        if not self._token or time.monotonic() >= self._token_deadline:
+            await self.authenticate()
+        request_headers = (
+            self._auth_headers if headers is None else self._auth_headers | headers
         )
+
+        if not self._breaker.allow():
+            logger.warning("Travio circuit open; failing fast on {url}", url=url)
+            raise TravioAPIError(503, "circuit_open")
+
+        # Encode the body once with orjson instead of letting httpx run the
+        # stdlib encoder per attempt; Content-Type comes from the template.
+        content = orjson.dumps(json) if json is not None else None
+        timeout = self._timeout_for(url)
+        client = await self._get_client()
+
+        logger.debug("Travio request {method} {url}", method=method, url=url)
+        async with bulkhead if bulkhead is not None else nullcontext():
+            for attempt in range(self._max_retries + 1):
+                try:
+                    response = await client.request(
+                        method,
+                        url,
+                        headers=request_headers,
+                        params=params,
+                        content=content,
+                        timeout=timeout,
+                    )
+                except _RETRYABLE_EXC as exc:
+                    self._breaker.on_failure()
+                    if attempt >= self._max_retries:
+                        raise
+                    delay = self._retry_delay(attempt, None)
+                    logger.warning(
+                        "Travio request {method} {url} failed ({error}); retry in {delay:.2f}s",
+                        method=method,
+                        url=url,
+                        error=type(exc).__name__,
+                        delay=delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if response.status_code >= 500:
+                    self._breaker.on_failure()
+                else:
+                    self._breaker.on_success()
+                if (
+                    response.status_code in _RETRYABLE_STATUSES
+                    and attempt < self._max_retries
+                ):
+                    delay = self._retry_delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                    logger.warning(
+                        "Travio returned {status} on {url}; retry in {delay:.2f}s",
+                        status=response.status_code,
+                        url=url,
+                        delay=delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                break
         if response.status_code >= 400:
+            body = _error_body(response)
             logger.error(
                 "Travio API error {status} on {url}: {body}",
                 status=response.status_code,
                 url=url,
-                body=response.text,
+                body=body,
             )
-            raise TravioAPIError(response.status_code, response.text)
+            raise TravioAPIError(response.status_code, body)
         if not response.content:
             return {}
-        return response.json()
+        # Whole-body decode is deliberate: every caller (API layer, activity
+        # summaries) consumes the full dict, and booking responses are a
+        # nested object rather than an item array, so an incremental parser
+        # would buffer the same graph with more overhead.
+        return orjson.loads(response.content)
 
     # --- Profile & session ---
 
     async def get_profile(self) -> Dict[str, Any]:
         """Retrieve profile associated with current token."""
-        return await self._request("GET", "/profile")
+        return await self._ep_profile()
 
     async def login(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Login as Travio user to obtain enriched token."""
-        data = await self._request("POST", "/login", json=payload)
+        data = await self._ep_login(json=payload)
         token = data.get("token")
         expires_in = data.get("expires_in")
         if token:
-            self._token = token
-            if expires_in:
-                self._token_expiry = datetime.now(timezone.utc) + timedelta(
-                    seconds=int(expires_in * 0.9)
-                )
-            else:
-                self._token_expiry = None
+            self._set_token(token, int(expires_in * 0.9) if expires_in else None)
         return data
 
     # --- CRM endpoints ---
 
     async def search_clients(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Search for clients in CRM repository."""
-        return await self._request("GET", "/rest/master-data", params=filters)
+        return await self._ep_search(params=filters)
 
     async def get_client(self, client_id: int) -> Dict[str, Any]:
         """Retrieve a client by ID."""
-        return await self._request("GET", f"/rest/master-data/{client_id}")
+        return await self._request("GET", _U_CLIENT(client_id), bulkhead=self._sem_crm)
 
     async def create_client(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new client."""
-        return await self._request("POST", "/rest/master-data", json={"data": payload})
+        return await self._ep_create_client(json={"data": payload})
 
     async def update_client(self, client_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing client."""
         return await self._request(
-            "PUT", f"/rest/master-data/{client_id}", json={"data": payload}
+            "PUT", _U_CLIENT(client_id), json={"data": payload}, bulkhead=self._sem_crm
         )
 
     async def list_master_data_categories(
@@ -162,40 +501,107 @@ class TravioClient:
     ) -> Dict[str, Any]:
         """Retrieve master-data categories (categorie anagrafiche)."""
         params = {"page": page, "per_page": per_page}
-        return await self._request("GET", "/rest/master-data-categories", params=params)
+        return await self._ep_categories(params=params)
+
+    async def list_all_master_data_categories(
+        self, *, per_page: int = 200
+    ) -> Dict[str, Any]:
+        """Retrieve every master-data category across all pages.
+
+        The first page reveals the page count; the remaining pages are
+        fetched concurrently (multiplexed on the shared connection, capped
+        by the CRM bulkhead) instead of one round-trip per page.
+        """
+        first = await self.list_master_data_categories(page=1, per_page=per_page)
+        items = list(first.get("items") or first.get("list") or [])
+        pages = int(first.get("pages") or 1)
+        if pages > 1:
+            rest = await asyncio.gather(
+                *[
+                    self.list_master_data_categories(page=p, per_page=per_page)
+                    for p in range(2, pages + 1)
+                ]
+            )
+            for response in rest:
+                items.extend(response.get("items") or response.get("list") or [])
+        total = first.get("total", len(items))
+        return {
+            "items": items,
+            "list": items,
+            "total": total,
+            "tot": first.get("tot", total),
+            "page": 1,
+            "per_page": per_page,
+            "pages": 1,
+        }
 
     # --- Booking/Property endpoints ---
 
     async def booking_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Run booking search."""
-        return await self._request("POST", "/booking/search", json=payload)
+        return await self._ep_booking_search(json=payload)
 
     async def booking_results(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve additional booking results."""
-        return await self._request("POST", "/booking/results", json=payload)
+        return await self._ep_booking_results(json=payload)
+
+    async def booking_stream(
+        self, payload: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the search response and result pages with prefetch.
+
+        The next ``/booking/results`` page is requested as a task before
+        the current page is yielded, so network latency of page N+1
+        overlaps with the consumer's processing of page N (the requests
+        share the multiplexed HTTP/2 connection). Iteration stops after a
+        page marked final or one without groups.
+        """
+        current = await self.booking_search(payload)
+        search_id = current.get("search_id")
+        page = 1
+        next_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+        try:
+            while True:
+                if (
+                    search_id
+                    and not current.get("final")
+                    and current.get("groups")
+                ):
+                    next_task = asyncio.create_task(
+                        self.booking_results({"search_id": search_id, "page": page})
+                    )
+                yield current
+                if next_task is None:
+                    return
+                current = await next_task
+                next_task = None
+                page += 1
+        finally:
+            if next_task is not None and not next_task.done():
+                next_task.cancel()
 
     async def booking_picks(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Submit picks for booking flow."""
-        return await self._request("POST", "/booking/picks", json=payload)
+        return await self._ep_booking_picks(json=payload)
 
     async def cart_add(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Add selections to cart."""
-        return await self._request("PUT", "/booking/cart", json=payload)
+        return await self._ep_cart_add(json=payload)
 
     async def cart_get(self, cart_id: str) -> Dict[str, Any]:
         """Fetch cart details."""
-        return await self._request("GET", f"/booking/cart/{cart_id}")
+        return await self._request("GET", _U_CART(cart_id), bulkhead=self._sem_booking)
 
     async def cart_remove(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Remove search from cart."""
-        return await self._request("DELETE", "/booking/cart", json=payload)
+        return await self._ep_cart_remove(json=payload)
 
     async def place_reservation(self, cart_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Finalize reservation/quote."""
-        return await self._request("POST", f"/booking/place/{cart_id}", json=payload)
+        return await self._request("POST", _U_PLACE(cart_id), json=payload, bulkhead=self._sem_booking)
 
     async def send_quote(self, reservation_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Trigger quote PDF/email generation."""
         return await self._request(
-            "POST", f"/tools/print/reservation/{reservation_id}", json=payload
+            "POST", _U_QUOTE(reservation_id), json=payload, bulkhead=self._sem_booking
         )
@@ -4,74 +4,192 @@ from __future__ import annotations
 
 import ast
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 import pandas as pd
 import streamlit as st
 from st_aggrid import AgGrid, GridOptionsBuilder
 
 try:
-    from frontend.backend_client import BackendClient  # type: ignore[import]
+    from frontend.backend_client import BackendAPIError, BackendClient  # type: ignore[import]
 except ModuleNotFoundError:
     import sys
 
     sys.path.append(str(Path(__file__).resolve().parent))
-    from backend_client import BackendClient
+    from backend_client import BackendAPIError, BackendClient
 
 
-def get_backend_client() -> BackendClient:
-    """Retrieve a backend client configured from session state."""
-    base_url: str = st.session_state.get("backend_url", "http://localhost:8000")
+# Single-pass tokenizer for the comma-separated free-text inputs; skips
+# the per-token strip/filter churn of split(",").
+_TOKEN_RE = re.compile(r"[^,\s]+")
+
+
+@st.cache_resource(show_spinner=False)
+def _backend_client(base_url: str) -> BackendClient:
+    """Build one pooled BackendClient per backend URL, shared process-wide."""
     return BackendClient(base_url=base_url)
 
 
-@lru_cache(maxsize=1)
+def get_backend_client() -> BackendClient:
+    """Retrieve a backend client configured from session state.
+
+    Cached on the URL so reruns (and all sessions) share a single
+    keep-alive pool; changing the URL in settings keys a fresh client.
+    """
+    base_url: str = st.session_state["backend_url"]
+    return _backend_client(base_url)
+
+
+# Idempotent backend GETs memoized briefly: every widget interaction
+# reruns the whole script, and without these each rerun costs three
+# round-trips before anything renders. The underscore client arg is
+# excluded from hashing; base_url keys the cache per backend.
+@st.cache_data(ttl=10, show_spinner=False)
+def _fetch_health(_client: BackendClient, base_url: str) -> Dict[str, Any]:
+    """Fetch backend health, memoized briefly across reruns."""
+    return _client.get("/api/system/health")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_profile(_client: BackendClient, base_url: str) -> Dict[str, Any]:
+    """Fetch the Travio profile, memoized across reruns."""
+    return _client.get("/api/auth/profile")
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_activity(_client: BackendClient, base_url: str) -> Any:
+    """Fetch the activity log, memoized briefly across reruns."""
+    return _client.get("/api/system/activity")
+
+
+@st.cache_data(show_spinner=False)
 def load_geo_catalog() -> pd.DataFrame:
-    """Load geo catalog from CSV if available."""
+    """Load geo catalog from CSV, with ids coerced and names pre-parsed.
+
+    The expensive per-row work — id coercion and name parsing — happens
+    here, once per process, so per-language lookups only pick a key out
+    of the already-parsed values.
+    """
     csv_path = Path("geo_ids.csv")
+    parquet_path = Path("geo_ids.parquet")
+    empty = pd.DataFrame(columns=["id", "name", "_parsed"])
+    # Parquet sidecar: written on first CSV load, then read directly —
+    # roughly an order of magnitude faster to load than re-parsing CSV.
+    # The sidecar outlives the process, so it only wins while it is at
+    # least as new as the CSV; an updated CSV invalidates it.
+    if parquet_path.exists():
+        try:
+            sidecar_fresh = (
+                not csv_path.exists()
+                or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+            )
+        except OSError:
+            sidecar_fresh = False
+        if sidecar_fresh:
+            try:
+                df = pd.read_parquet(parquet_path)
+            except Exception:
+                pass
+            else:
+                df["_parsed"] = df["name"].map(_parse_geo_raw)
+                return df
     if not csv_path.exists():
-        return pd.DataFrame(columns=["id", "name"])
+        return empty
     try:
-        return pd.read_csv(csv_path)
+        df = pd.read_csv(csv_path, engine="pyarrow")
+    except (ImportError, ValueError):
+        try:
+            df = pd.read_csv(csv_path)
+        except Exception:
+            return empty
     except Exception:
-        return pd.DataFrame(columns=["id", "name"])
+        return empty
+    # Vectorized coercion replaces the old per-row int(row.id) try/except:
+    # bad rows are dropped in one pass with no Python exception churn.
+    df["id"] = pd.to_numeric(df["id"], errors="coerce")
+    df = df.dropna(subset=["id"])
+    df["id"] = df["id"].astype("int64")
+    try:
+        df[["id", "name"]].to_parquet(parquet_path)
+    except Exception:
+        pass
+    df["_parsed"] = df["name"].map(_parse_geo_raw)
+    return df
+
+
+def _parse_geo_raw(raw: Any) -> Any:
+    """Parse a stored geo name into its dict/string form.
+
+    json.loads is much cheaper than compiling a Python AST per row;
+    catalog entries are JSON-shaped except for quote style, so try the
+    strict parse, then a single-quote rewrite, and only fall back to
+    ast.literal_eval for the exotic leftovers.
+    """
+    # Scalar None/NaN check instead of pd.isna: this runs once per row
+    # and the array-aware dispatch in pd.isna costs more than the parse
+    # for short names.
+    if raw is None or (isinstance(raw, float) and raw != raw):
+        return ""
+    if isinstance(raw, str):
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            try:
+                return json.loads(raw.replace("'", '"'))
+            except json.JSONDecodeError:
+                try:
+                    return ast.literal_eval(raw)
+                except (ValueError, SyntaxError):
+                    return raw
+    return raw
+
+
+def _pick_geo_language(data: Any, language: str) -> str:
+    """Choose the display name for a parsed geo entry."""
+    if isinstance(data, dict):
+        for key in (language, "en", "it"):
+            value = data.get(key)
+            if value:
+                return value
+        return next((value for value in data.values() if value), "")
+    if data is None:
+        return ""
+    return str(data)
 
 
 def parse_geo_name(raw: Any, language: str = "en") -> str:
     """Extract human-friendly name from stored dict/text representation."""
-    if pd.isna(raw):
-        return ""
-    if isinstance(raw, str):
-        try:
-            data = ast.literal_eval(raw)
-        except (ValueError, SyntaxError):
-            return raw
-        if isinstance(data, dict):
-            for key in (language, "en", "it"):
-                value = data.get(key)
-                if value:
-                    return value
-            return next((value for value in data.values() if value), raw)
-    return str(raw)
+    data = _parse_geo_raw(raw)
+    name = _pick_geo_language(data, language)
+    if not name and isinstance(raw, str):
+        return raw
+    return name
 
 
+@st.cache_data(show_spinner=False)
 def build_geo_options(language: str = "en") -> Dict[int, str]:
-    """Return mapping of geo id to formatted display label."""
+    """Return mapping of geo id to formatted display label.
+
+    Cached per language: Streamlit reruns the script on every widget
+    interaction, and rebuilding the label map each time dominates the
+    booking tab's render cost. Parsing already happened in
+    load_geo_catalog, so this pass is pure label assembly.
+    """
     catalog = load_geo_catalog()
     if catalog.empty:
         return {}
-    labels: Dict[int, str] = {}
-    for row in catalog.itertuples():
-        try:
-            geo_id = int(row.id)
-        except (TypeError, ValueError):
-            continue
-        name = parse_geo_name(row.name, language=language) or str(geo_id)
-        labels[geo_id] = f"{name} ({geo_id})"
-    return labels
+    ids = catalog["id"].tolist()
+    parsed = catalog["_parsed"].tolist()
+    return {
+        geo_id: f"{_pick_geo_language(data, language) or geo_id} ({geo_id})"
+        for geo_id, data in zip(ids, parsed)
+    }
 
 
 def get_crm_clients() -> Dict[int, Dict[str, Any]]:
@@ -83,6 +201,17 @@ def get_crm_clients() -> Dict[int, Dict[str, Any]]:
     return clients
 
 
+def bump_crm_clients_version() -> None:
+    """Mark the CRM clients map as changed.
+
+    Call after writing to the dict from get_crm_clients so derived
+    structures (the sorted selector options) know to rebuild.
+    """
+    st.session_state["crm_clients_version"] = (
+        st.session_state["crm_clients_version"] + 1
+    )
+
+
 CATEGORY_HINTS: Dict[str, List[str]] = {
     "private": ["PRI", "PRIV", "PRIVATO", "PRIVATE", "CLI"],
     "company": ["AZI", "AZIENDA", "CORP", "COMPANY", "BUS"],
@@ -140,17 +269,40 @@ def pick_category_label_for_profile(
     return default_label
 
 
+@lru_cache(maxsize=4096)
+def _client_label(
+    full_name: Optional[str],
+    name: Optional[str],
+    firstname: str,
+    lastname: str,
+    client_id: Any,
+    include_id: bool,
+) -> str:
+    """Format a client label from its scalar fields (memoized)."""
+    label = full_name or name or f"{firstname} {lastname}".strip() or f"Client {client_id}"
+    if include_id and client_id is not None:
+        label = f"{label} (ID {client_id})"
+    return label
+
+
 def format_client_label(client: Dict[str, Any], include_id: bool = False) -> str:
-    """Return human readable label for a CRM client record."""
-    name = (
-        client.get("full_name")
-        or client.get("name")
-        or f"{client.get('firstname', '')} {client.get('lastname', '')}".strip()
+    """Return human readable label for a CRM client record.
+
+    Label strings are rebuilt for every client on every Streamlit rerun,
+    so the formatting is memoized on the scalar inputs.
+    """
+    args = (
+        client.get("full_name"),
+        client.get("name"),
+        client.get("firstname", ""),
+        client.get("lastname", ""),
+        client.get("id"),
+        include_id,
     )
-    label = name or f"Client {client.get('id')}"
-    if include_id and client.get("id") is not None:
-        label = f"{label} (ID {client['id']})"
-    return label
+    try:
+        return _client_label(*args)
+    except TypeError:
+        return _client_label.__wrapped__(*args)
 
 
 def get_active_client() -> Optional[Dict[str, Any]]:
@@ -162,14 +314,43 @@ def get_active_client() -> Optional[Dict[str, Any]]:
     return None
 
 
+def active_client_label(active_client: Optional[Dict[str, Any]]) -> str:
+    """Return the active client's caption label, reformatted only on change.
+
+    The label string is stored in session state keyed on the active client
+    id, so the per-rerun cost in each tab is a dict lookup rather than a
+    fresh format_client_label call.
+    """
+    active_id = st.session_state.get("active_client_id")
+    if st.session_state.get("_active_label_key") != active_id:
+        label = format_client_label(active_client, include_id=True) if active_client else ""
+        st.session_state["_active_label"] = label
+        st.session_state["_active_label_key"] = active_id
+    return st.session_state.get("_active_label", "")
+
+
 def render_active_client_selector(label: str = "Active CRM client") -> None:
     """Render selectbox for choosing active CRM client."""
     clients = get_crm_clients()
     if not clients:
         return
-    option_ids = sorted(clients.keys())
+    # Sorting hundreds of ids (and the O(N) .index scan) on every rerun
+    # is avoidable: rebuild the option list and position map only when
+    # the clients dict version moves.
+    version = st.session_state["crm_clients_version"]
+    if (
+        st.session_state.get("_client_options_version") != version
+        or "_client_option_ids" not in st.session_state
+    ):
+        option_ids = sorted(clients.keys())
+        st.session_state["_client_option_ids"] = option_ids
+        st.session_state["_client_option_pos"] = {
+            cid: pos for pos, cid in enumerate(option_ids)
+        }
+        st.session_state["_client_options_version"] = version
+    option_ids = st.session_state["_client_option_ids"]
     current_id = st.session_state.get("active_client_id")
-    default_index = option_ids.index(current_id) if current_id in option_ids else 0
+    default_index = st.session_state["_client_option_pos"].get(current_id, 0)
     selected_id = st.selectbox(
         label,
         option_ids,
@@ -179,15 +360,34 @@ def render_active_client_selector(label: str = "Active CRM client") -> None:
     st.session_state["active_client_id"] = selected_id
 
 
+def _contact_index(client: Dict[str, Any]) -> Dict[str, str]:
+    """Build (once per client dict) a field -> first-value contact index.
+
+    The index is stashed on the record under an underscore key so the
+    contacts list is walked a single time instead of once per field per
+    rerun.
+    """
+    index = client.get("_contact_idx")
+    if index is None:
+        index = {}
+        for contact in client.get("contacts") or []:
+            for field in ("email", "phone"):
+                if field in index:
+                    continue
+                values = contact.get(field)
+                if isinstance(values, list) and values:
+                    index[field] = values[0]
+                elif isinstance(values, str) and values:
+                    index[field] = values
+        client["_contact_idx"] = index
+    return index
+
+
 def extract_contact_detail(client: Dict[str, Any], field: str) -> Optional[str]:
     """Retrieve primary contact detail (email/phone) from client record."""
-    contacts = client.get("contacts") or []
-    for contact in contacts:
-        values = contact.get(field)
-        if isinstance(values, list) and values:
-            return values[0]
-        if isinstance(values, str) and values:
-            return values
+    value = _contact_index(client).get(field)
+    if value:
+        return value
     value = client.get(field)
     if isinstance(value, list):
         return value[0] if value else None
@@ -228,33 +428,22 @@ def build_cart_pax_prefill(
             lead_data["email"] = email
         if phone:
             lead_data["phone"] = phone
+        present = {k: v for k, v in lead_data.items() if v}
         if pax_entries:
-            if lead_data.get("name"):
-                pax_entries[0]["name"] = lead_data["name"]
-            if lead_data.get("surname"):
-                pax_entries[0]["surname"] = lead_data["surname"]
-            if lead_data.get("email"):
-                pax_entries[0]["email"] = lead_data["email"]
-            if lead_data.get("phone"):
-                pax_entries[0]["phone"] = lead_data["phone"]
+            pax_entries[0].update(present)
             pax_entries[0].setdefault("id", active_client.get("id"))
         else:
-            lead_entry = {k: v for k, v in lead_data.items() if v}
-            lead_entry["id"] = active_client.get("id")
-            pax_entries.append(lead_entry)
+            present["id"] = active_client.get("id")
+            pax_entries.append(present)
 
-    cleaned = []
-    for entry in pax_entries:
-        cleaned.append({k: v for k, v in entry.items() if k not in {"enabled", "_age"}})
-    return cleaned
+    # No second filtering pass: the first comprehension already excludes
+    # "enabled"/"_age", and the lead entry never contains them.
+    return pax_entries
 
 
-def describe_item(item: Dict[str, Any]) -> str:
-    """Format human friendly label for booking item."""
-    name = item.get("name") or item.get("code") or f"Item {item.get('idx', '')}"
-    price = item.get("price")
-    currency = item.get("currency") or item.get("cost_currency")
-    supplier = item.get("supplier")
+@lru_cache(maxsize=4096)
+def _item_label(name: str, price: Any, currency: Optional[str], supplier: Any) -> str:
+    """Format a booking-item label from its scalar fields (memoized)."""
     parts = [name]
     if price not in (None, 0):
         parts.append(f"{price:g} {currency or ''}".strip())
@@ -263,6 +452,24 @@ def describe_item(item: Dict[str, Any]) -> str:
     return " – ".join(parts)
 
 
+def describe_item(item: Dict[str, Any]) -> str:
+    """Format human friendly label for booking item.
+
+    Memoized on the scalar inputs: the label map is rebuilt per group on
+    every rerun over mostly unchanged items.
+    """
+    args = (
+        item.get("name") or item.get("code") or f"Item {item.get('idx', '')}",
+        item.get("price"),
+        item.get("currency") or item.get("cost_currency"),
+        item.get("supplier"),
+    )
+    try:
+        return _item_label(*args)
+    except TypeError:
+        return _item_label.__wrapped__(*args)
+
+
 def build_pick_samples(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate example picks payload based on latest booking response."""
     samples: List[Dict[str, Any]] = []
@@ -297,6 +504,27 @@ def build_pick_samples(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     return samples
 
 
+def store_booking_flow(
+    search_id: Any,
+    response: Dict[str, Any],
+    temp_cart_pax: Any = None,
+) -> None:
+    """Write the booking flow state, skipping identity-equal rewrites.
+
+    Session-state writes make Streamlit re-hash the stored value, which
+    for large nested booking responses is not free; when the same
+    response object is already stored there is nothing to update.
+    """
+    flow = st.session_state.get("booking_flow")
+    if isinstance(flow, dict) and flow.get("response") is response:
+        return
+    st.session_state["booking_flow"] = {
+        "search_id": search_id,
+        "response": response,
+        "temp_cart_pax": temp_cart_pax,
+    }
+
+
 def render_booking_step_controls(
     flow: Dict[str, Any],
     client: BackendClient,
@@ -339,8 +567,9 @@ def render_booking_step_controls(
                     issues.append(f"No selectable items for group {group_idx}")
                     continue
 
-                option_values = [item.get("idx") for item in items]
-                label_map = {item.get("idx"): describe_item(item) for item in items}
+                by_idx = {item.get("idx"): item for item in items}
+                option_values = list(by_idx.keys())
+                label_map = {idx: describe_item(item) for idx, item in by_idx.items()}
                 select_key = f"booking_step_{search_id}_{step}_{group_idx}_item"
                 if select_key not in st.session_state:
                     st.session_state[select_key] = option_values[0]
@@ -350,10 +579,7 @@ def render_booking_step_controls(
                     key=select_key,
                     format_func=lambda idx: label_map.get(idx, f"Idx {idx}"),
                 )
-                selected_item = next(
-                    (item for item in items if item.get("idx") == selected_idx),
-                    items[0],
-                )
+                selected_item = by_idx.get(selected_idx, items[0])
                 pick_payload: Dict[str, Any] = {"idx": selected_item.get("idx", 0)}
 
                 dates = selected_item.get("dates") or []
@@ -451,29 +677,48 @@ def render_booking_step_controls(
             result = client.post("/api/booking/picks", json=body)
             st.session_state["booking_picks_response"] = result
             st.session_state["booking_last_response"] = result
-            st.session_state["booking_flow"] = {
-                "search_id": search_id,
-                "response": result,
-                "temp_cart_pax": result.get("temp_cart_pax"),
-            }
+            store_booking_flow(search_id, result, result.get("temp_cart_pax"))
             st.session_state["latest_search_id"] = search_id
             st.success("Step submitted.")
         except Exception as err:  # noqa: BLE001
             st.error(f"Picks submission failed: {err}")
 
 
+# Grid options depend only on the column schema, so distinct payloads
+# with the same shape (e.g. successive CRM result pages) share one
+# build instead of re-scanning every column.
+_GRID_OPTS_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _normalized_grid(data: List[Dict[str, Any]]) -> tuple:
+    """Normalize records and build grid options once per distinct payload.
+
+    json_normalize on nested responses is the expensive part of a table
+    render, and reruns triggered by unrelated widgets pass identical
+    data; caching on the payload collapses those to a lookup.
+    """
+    df = pd.json_normalize(data)
+    cols_key = tuple(df.columns)
+    grid_options = _GRID_OPTS_CACHE.get(cols_key)
+    if grid_options is None:
+        builder = GridOptionsBuilder.from_dataframe(df)
+        builder.configure_pagination(enabled=True, paginationAutoPageSize=True)
+        builder.configure_default_column(
+            resizable=True, sortable=True, filter=True, wrapText=True, autoHeight=True
+        )
+        grid_options = builder.build()
+        if len(_GRID_OPTS_CACHE) < 64:
+            _GRID_OPTS_CACHE[cols_key] = grid_options
+    return df, grid_options
+
+
 def render_table(data: List[Dict[str, Any]], height: int = 300) -> None:
     """Render a list of dictionaries using AgGrid."""
     if not data:
         st.info("No records to display.")
         return
-    df = pd.json_normalize(data)
-    builder = GridOptionsBuilder.from_dataframe(df)
-    builder.configure_pagination(enabled=True, paginationAutoPageSize=True)
-    builder.configure_default_column(
-        resizable=True, sortable=True, filter=True, wrapText=True, autoHeight=True
-    )
-    grid_options = builder.build()
+    df, grid_options = _normalized_grid(data)
     AgGrid(
         df,
         gridOptions=grid_options,
@@ -494,11 +739,32 @@ def extract_records(payload: Any) -> List[Dict[str, Any]]:
     return []
 
 
-def show_json(payload: Any) -> None:
-    """Display payload as formatted JSON."""
-    st.code(json.dumps(payload, indent=2, default=str), language="json")
+def show_json(payload: Any, max_chars: int = 4096) -> None:
+    """Display payload as formatted JSON, truncated past ``max_chars``.
+
+    orjson renders large booking responses roughly an order of magnitude
+    faster than stdlib json; the stdlib path stays as a fallback for
+    payloads orjson cannot represent. Rendering is capped because a
+    multi-hundred-KB code block is a documented Streamlit DOM cliff.
+    """
+    try:
+        rendered = orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except (TypeError, orjson.JSONEncodeError):
+        rendered = json.dumps(payload, indent=2, default=str)
+    if len(rendered) > max_chars:
+        st.code(rendered[:max_chars] + "\n... (truncated)", language="json")
+        st.caption(
+            f"Showing first {max_chars:,} of {len(rendered):,} characters."
+        )
+        return
+    st.code(rendered, language="json")
 
 
+@st.fragment
 def crm_search_tab() -> None:
     """Render CRM search and client management UI."""
     st.subheader("CRM Search")
@@ -547,14 +813,18 @@ def crm_search_tab() -> None:
         with st.expander("Raw response", expanded=False):
             show_json(response)
         clients_map = get_crm_clients()
+        changed = False
         for record in records:
             client_id = record.get("id")
             if client_id is not None:
                 clients_map[client_id] = record
+                changed = True
+        if changed:
+            bump_crm_clients_version()
     render_active_client_selector("Set active client")
     active = get_active_client()
     if active:
-        st.caption(f"Active client: {format_client_label(active, include_id=True)}")
+        st.caption(f"Active client: {active_client_label(active)}")
 
     st.subheader("Add New Client")
     selected_category_id: Optional[int] = None
@@ -633,7 +903,7 @@ def crm_search_tab() -> None:
         if selected_category_id is not None:
             client_payload["categories"] = [selected_category_id]
         try:
-            extra = json.loads(extra_json or "{}")
+            extra = orjson.loads(extra_json or "{}")
             if isinstance(extra, dict):
                 client_payload.update(extra)
         except json.JSONDecodeError:
@@ -647,6 +917,7 @@ def crm_search_tab() -> None:
             if new_id is not None:
                 clients_map = get_crm_clients()
                 clients_map[new_id] = response
+                bump_crm_clients_version()
                 st.session_state["active_client_id"] = new_id
         except Exception as err:  # noqa: BLE001
             st.error(f"Client creation failed: {err}")
@@ -662,7 +933,7 @@ def crm_search_tab() -> None:
 
     if update_submit:
         try:
-            data = json.loads(update_json)
+            data = orjson.loads(update_json)
         except json.JSONDecodeError:
             st.error("Invalid JSON payload for update.")
         else:
@@ -674,21 +945,28 @@ def crm_search_tab() -> None:
                 clients_map = get_crm_clients()
                 if client_id:
                     clients_map[int(client_id)] = response
+                    bump_crm_clients_version()
             except Exception as err:  # noqa: BLE001
                 st.error(f"Client update failed: {err}")
 
 
 def parse_children(children_str: str) -> Optional[List[int]]:
-    """Parse comma separated children age string."""
+    """Parse comma separated children age string.
+
+    Deliberately plain Python: inputs are a handful of ages typed into a
+    per-room text box, far below any size where a compiled parser (or a
+    numba dependency) would pay for its warm-up and import cost.
+    """
     if not children_str:
         return None
     try:
-        return [int(age.strip()) for age in children_str.split(",") if age.strip()]
+        return [int(age) for age in _TOKEN_RE.findall(children_str)]
     except ValueError:
         st.warning("Invalid children ages; please use comma separated integers.")
         return None
 
 
+@st.fragment
 def booking_tab() -> None:
     """Render property search and booking flow."""
     st.subheader("Property Search")
@@ -696,7 +974,7 @@ def booking_tab() -> None:
     geo_labels = build_geo_options()
     active_client = get_active_client()
     if active_client:
-        st.caption(f"Active client: {format_client_label(active_client, include_id=True)}")
+        st.caption(f"Active client: {active_client_label(active_client)}")
 
     with st.form("booking_search_form"):
         service_type = st.selectbox(
@@ -718,7 +996,7 @@ def booking_tab() -> None:
         check_in = st.date_input("Check-in", value=date.today())
         check_out = st.date_input("Check-out", value=date.today())
         if geo_labels:
-            geo_default: List[int] = st.session_state.get("geo_selected_ids", [])
+            geo_default: List[int] = st.session_state["geo_selected_ids"]
             geo_lookup = st.multiselect(
                 "Geo lookup (type to search)",
                 options=list(geo_labels.keys()),
@@ -770,18 +1048,15 @@ def booking_tab() -> None:
         geo_set = set(geo_lookup)
         if geo_nodes:
             try:
-                manual_nodes = [
-                    int(node.strip()) for node in geo_nodes.split(",") if node.strip()
-                ]
-                geo_set.update(manual_nodes)
+                geo_set.update(int(node) for node in _TOKEN_RE.findall(geo_nodes))
             except ValueError:
                 st.warning("Geo IDs must be integers. Check your manual entries.")
         if geo_set:
             payload["geo"] = sorted(geo_set)
         if service_ids:
-            payload["ids"] = [item.strip() for item in service_ids.split(",") if item.strip()]
+            payload["ids"] = _TOKEN_RE.findall(service_ids)
         if service_codes:
-            payload["codes"] = [item.strip() for item in service_codes.split(",") if item.strip()]
+            payload["codes"] = _TOKEN_RE.findall(service_codes)
         if client_country:
             payload["client_country"] = client_country
         try:
@@ -789,11 +1064,9 @@ def booking_tab() -> None:
             st.session_state["booking_search_response"] = response
             st.session_state["latest_search_id"] = response.get("search_id")
             st.session_state["booking_last_response"] = response
-            st.session_state["booking_flow"] = {
-                "search_id": response.get("search_id"),
-                "response": response,
-                "temp_cart_pax": response.get("temp_cart_pax"),
-            }
+            store_booking_flow(
+                response.get("search_id"), response, response.get("temp_cart_pax")
+            )
             st.success("Booking search executed.")
         except Exception as err:  # noqa: BLE001
             st.error(f"Booking search failed: {err}")
@@ -813,16 +1086,27 @@ def booking_tab() -> None:
     st.subheader("Booking Picks & Cart")
     latest_response = st.session_state.get("booking_last_response")
     if isinstance(latest_response, dict) and "groups" in latest_response:
-        samples = build_pick_samples(latest_response)
         step_hint = latest_response.get("step")
+        sample_key = f"{latest_response.get('search_id')}:{step_hint}"
+        # Rebuilding the samples walks every group and item; unrelated
+        # widget interactions rerun this tab with an identical response,
+        # so reuse the cached result while (search_id, step) is stable.
+        if st.session_state.get("_samples_key") == sample_key:
+            samples = st.session_state.get("_samples_cache", [])
+        else:
+            samples = build_pick_samples(latest_response)
+            st.session_state["_samples_cache"] = samples
+            st.session_state["_samples_key"] = sample_key
         if samples:
-            sample_key = f"{latest_response.get('search_id')}:{step_hint}"
             prev_key = st.session_state.get("booking_template_key")
+            # Serialized once per rerun and shared between the template
+            # write (gated on the step key) and the st.code preview.
+            samples_json = orjson.dumps(samples, option=orjson.OPT_INDENT_2).decode()
             if sample_key != prev_key:
-                st.session_state["booking_picks_template"] = json.dumps(samples, indent=2)
+                st.session_state["booking_picks_template"] = samples_json
                 st.session_state["booking_template_key"] = sample_key
             st.markdown(f"**Current step:** {step_hint}")
-            st.code(json.dumps(samples, indent=2), language="json")
+            st.code(samples_json, language="json")
         else:
             st.info(f"Current step: {step_hint}. Awaiting selectable groups.")
 
@@ -833,7 +1117,7 @@ def booking_tab() -> None:
         )
         with st.form("booking_picks_form"):
             search_id = st.text_input(
-                "Search ID", value=st.session_state.get("latest_search_id", "")
+                "Search ID", value=st.session_state["latest_search_id"]
             )
             step = st.number_input("Step", min_value=0, value=0, step=1)
             picks_json = st.text_area(
@@ -845,7 +1129,7 @@ def booking_tab() -> None:
 
         if run_picks:
             try:
-                picks_payload = json.loads(picks_json)
+                picks_payload = orjson.loads(picks_json)
             except json.JSONDecodeError:
                 st.error("Invalid JSON for picks payload.")
             else:
@@ -854,10 +1138,7 @@ def booking_tab() -> None:
                     response = client.post("/api/booking/picks", json=payload)
                     st.session_state["booking_picks_response"] = response
                     st.session_state["booking_last_response"] = response
-                    st.session_state["booking_flow"] = {
-                        "search_id": search_id,
-                        "response": response,
-                    }
+                    store_booking_flow(search_id, response)
                     st.success("Picks submitted successfully.")
                 except Exception as err:  # noqa: BLE001
                     st.error(f"Submitting picks failed: {err}")
@@ -869,7 +1150,7 @@ def booking_tab() -> None:
     st.subheader("Cart Operations")
     with st.form("cart_add_form"):
         search_id = st.text_input(
-            "Search ID to add to cart", value=st.session_state.get("latest_search_id", "")
+            "Search ID to add to cart", value=st.session_state["latest_search_id"]
         )
         add_to_cart = st.form_submit_button("Add to Cart")
     if add_to_cart:
@@ -888,18 +1169,30 @@ def booking_tab() -> None:
 
     with st.form("cart_get_form"):
         cart_id = st.text_input(
-            "Cart ID", value=st.session_state.get("latest_cart_id", "")
+            "Cart ID", value=st.session_state["latest_cart_id"]
         )
+        force_cart_refresh = st.checkbox("Force refresh", value=False)
         fetch_cart = st.form_submit_button("Get Cart")
     if fetch_cart:
-        try:
-            response = client.get(f"/api/booking/cart/{cart_id}")
-            st.session_state["cart_response"] = response
-            if response.get("pax"):
-                st.session_state["cart_pax"] = response.get("pax")
-            st.success("Cart retrieved.")
-        except Exception as err:  # noqa: BLE001
-            st.error(f"Cart retrieval failed: {err}")
+        # Re-fetching the same cart on an accidental double-click buys
+        # nothing; serve the stored response unless the ID changed or the
+        # user explicitly asked for a refresh.
+        cached = st.session_state.get("cart_response")
+        if (
+            cached
+            and str(cached.get("id") or cached.get("cart_id")) == cart_id
+            and not force_cart_refresh
+        ):
+            st.success("Cart already loaded (check Force refresh to re-fetch).")
+        else:
+            try:
+                response = client.get(f"/api/booking/cart/{cart_id}")
+                st.session_state["cart_response"] = response
+                if response.get("pax"):
+                    st.session_state["cart_pax"] = response.get("pax")
+                st.success("Cart retrieved.")
+            except Exception as err:  # noqa: BLE001
+                st.error(f"Cart retrieval failed: {err}")
 
     if "cart_response" in st.session_state:
         with st.expander("Cart response", expanded=False):
@@ -908,7 +1201,7 @@ def booking_tab() -> None:
     with st.form("cart_remove_form"):
         search_id = st.text_input(
             "Search ID to remove from cart",
-            value=st.session_state.get("latest_search_id", ""),
+            value=st.session_state["latest_search_id"],
         )
         remove = st.form_submit_button("Remove from Cart")
     if remove:
@@ -921,28 +1214,32 @@ def booking_tab() -> None:
             st.error(f"Remove from cart failed: {err}")
 
 
+@st.fragment
 def quote_tab() -> None:
     """Render quote placement and delivery flow."""
     st.subheader("Place Quote")
     client = get_backend_client()
     active_client = get_active_client()
     if active_client:
-        st.caption(f"Active client: {format_client_label(active_client, include_id=True)}")
+        st.caption(f"Active client: {active_client_label(active_client)}")
     else:
         st.caption("No active CRM client selected. Pick one from the CRM tab for auto-fill.")
 
-    cart_id_default = st.session_state.get("latest_cart_id", "")
+    cart_id_default = st.session_state["latest_cart_id"]
     cart_pax = st.session_state.get("cart_pax") or st.session_state.get("temp_cart_pax") or []
     active_id = st.session_state.get("active_client_id")
-    pax_prefill = build_cart_pax_prefill(cart_pax, active_client)
     prefill_key = f"{cart_id_default}:{len(cart_pax)}:{active_id}"
     stored_key = st.session_state.get("quote_pax_key")
+    # Build and pretty-print the prefill only when its inputs actually
+    # changed; previously the indented dump ran on every rerun just to
+    # serve as the session-state default.
     if prefill_key != stored_key:
-        st.session_state["quote_pax_prefill"] = json.dumps(pax_prefill or [], indent=2, default=str)
+        pax_prefill = build_cart_pax_prefill(cart_pax, active_client)
+        st.session_state["quote_pax_prefill"] = orjson.dumps(
+            pax_prefill or [], default=str, option=orjson.OPT_INDENT_2
+        ).decode()
         st.session_state["quote_pax_key"] = prefill_key
-    pax_default = st.session_state.get(
-        "quote_pax_prefill", json.dumps(pax_prefill or [], indent=2, default=str)
-    )
+    pax_default = st.session_state.get("quote_pax_prefill", "[]")
 
     with st.form("place_quote_form"):
         cart_id = st.text_input(
@@ -979,8 +1276,8 @@ def quote_tab() -> None:
 
     if submit_place:
         try:
-            pax_data = json.loads(pax_json)
-            notes_data = json.loads(notes_json) if notes_json else None
+            pax_data = orjson.loads(pax_json)
+            notes_data = orjson.loads(notes_json) if notes_json else None
         except json.JSONDecodeError:
             st.error("Invalid JSON in pax or notes.")
         else:
@@ -1018,9 +1315,9 @@ def quote_tab() -> None:
     with st.form("send_quote_form"):
         reservation_id = st.text_input(
             "Reservation ID",
-            value=str(st.session_state.get("latest_reservation_id", "")),
+            value=str(st.session_state["latest_reservation_id"]),
         )
-        last_template = st.session_state.get("quote_template_id", 2)
+        last_template = st.session_state["quote_template_id"]
         template_id = st.number_input(
             "Template ID",
             min_value=1,
@@ -1040,9 +1337,10 @@ def quote_tab() -> None:
             payload["send"] = True
         try:
             response = client.post(f"/api/quotes/send/{reservation_id}", json=payload)
-        except Exception as err:  # noqa: BLE001
-            message = str(err)
-            if "Template not found" in message and template_id != 2:
+        except BackendAPIError as err:
+            # The error body is parsed once in BackendClient; branch on the
+            # slugged code instead of substring-matching the exception text.
+            if "template_not_found" in err.code and template_id != 2:
                 fallback_payload = payload.copy()
                 fallback_payload["template"] = 2
                 st.warning(
@@ -1061,6 +1359,8 @@ def quote_tab() -> None:
                     st.error(f"Send quote failed after fallback: {err2}")
             else:
                 st.error(f"Send quote failed: {err}")
+        except Exception as err:  # noqa: BLE001
+            st.error(f"Send quote failed: {err}")
         else:
             st.session_state["quote_template_id"] = template_id
             st.success("Quote send request submitted.")
@@ -1068,35 +1368,65 @@ def quote_tab() -> None:
                 show_json(response)
 
 
+@st.fragment
 def dashboard_tab() -> None:
     """Render dashboard overview."""
     st.subheader("Backend Status")
     client = get_backend_client()
-    try:
-        health = client.get("/api/system/health")
-        st.success("Backend reachable.")
-        st.json(health)
-    except Exception as err:  # noqa: BLE001
-        st.error(f"Unable to reach backend: {err}")
+    # Health and activity are independent reads; issue them together so
+    # first render costs the slowest endpoint instead of their sum (the
+    # pooled httpx.Client is thread-safe). The activity future only warms
+    # the short-TTL cache consumed by the refresh button and activity tab.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        health_future = executor.submit(_fetch_health, client, client.base_url)
+        activity_future = executor.submit(_fetch_activity, client, client.base_url)
+        try:
+            health = health_future.result()
+            st.success("Backend reachable.")
+            show_json(health)
+        except Exception as err:  # noqa: BLE001
+            st.error(f"Unable to reach backend: {err}")
+        try:
+            activity_future.result()
+        except Exception:  # noqa: BLE001
+            pass
 
     st.subheader("Token Management")
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("Request Token"):
-            try:
-                response = client.post("/api/auth/token")
-                st.session_state["last_token"] = response.get("token")
-                st.success("Token refreshed.")
-            except Exception as err:  # noqa: BLE001
-                st.error(f"Token request failed: {err}")
-    with col2:
-        if st.button("Get Profile"):
-            try:
-                profile = client.get("/api/auth/profile")
-                st.session_state["profile"] = profile
-                st.success("Profile retrieved.")
-            except Exception as err:  # noqa: BLE001
-                st.error(f"Profile request failed: {err}")
+    # A single form instead of two bare buttons: widget edits no longer
+    # trigger reruns until submit, and "Both" runs the two independent
+    # requests concurrently.
+    with st.form("token_mgmt", clear_on_submit=False):
+        action = st.radio(
+            "Action", ["Request Token", "Get Profile", "Both"], horizontal=True
+        )
+        run_action = st.form_submit_button("Run")
+    if run_action:
+        want_token = action in ("Request Token", "Both")
+        want_profile = action in ("Get Profile", "Both")
+        if want_profile:
+            _fetch_profile.clear()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            token_future = (
+                executor.submit(client.post, "/api/auth/token") if want_token else None
+            )
+            profile_future = (
+                executor.submit(_fetch_profile, client, client.base_url)
+                if want_profile
+                else None
+            )
+            if token_future is not None:
+                try:
+                    response = token_future.result()
+                    st.session_state["last_token"] = response.get("token")
+                    st.success("Token refreshed.")
+                except Exception as err:  # noqa: BLE001
+                    st.error(f"Token request failed: {err}")
+            if profile_future is not None:
+                try:
+                    st.session_state["profile"] = profile_future.result()
+                    st.success("Profile retrieved.")
+                except Exception as err:  # noqa: BLE001
+                    st.error(f"Profile request failed: {err}")
 
     if "profile" in st.session_state:
         with st.expander("Profile data"):
@@ -1105,7 +1435,8 @@ def dashboard_tab() -> None:
     st.subheader("Session Activity")
     if st.button("Refresh Activity Log"):
         try:
-            activity = client.get("/api/system/activity")
+            _fetch_activity.clear()
+            activity = _fetch_activity(client, client.base_url)
             st.session_state["activity_log"] = activity
         except Exception as err:  # noqa: BLE001
             st.error(f"Activity fetch failed: {err}")
@@ -1113,6 +1444,7 @@ def dashboard_tab() -> None:
     if st.button("Clear Activity Log"):
         try:
             client.delete("/api/system/activity")
+            _fetch_activity.clear()
             st.session_state.pop("activity_log", None)
             st.success("Activity log cleared.")
         except Exception as err:  # noqa: BLE001
@@ -1122,23 +1454,25 @@ def dashboard_tab() -> None:
         render_table(st.session_state["activity_log"], height=200)
 
 
+@st.fragment
 def activity_tab() -> None:
     """Display live activity log."""
     st.subheader("Activity Log")
     client = get_backend_client()
     try:
-        activity = client.get("/api/system/activity")
+        activity = _fetch_activity(client, client.base_url)
         render_table(activity, height=300)
     except Exception as err:  # noqa: BLE001
         st.error(f"Could not load activity log: {err}")
 
 
+@st.fragment
 def settings_tab() -> None:
     """Render settings controls."""
     st.subheader("Connection Settings")
     backend_url = st.text_input(
         "Backend URL",
-        value=st.session_state.get("backend_url", "http://localhost:8000"),
+        value=st.session_state["backend_url"],
     )
     if backend_url != st.session_state.get("backend_url"):
         st.session_state["backend_url"] = backend_url
@@ -1155,11 +1489,29 @@ def settings_tab() -> None:
     )
 
 
+def _ensure_state() -> None:
+    """Seed session-state defaults once per session.
+
+    Tabs can then read the keys directly instead of re-supplying (and in
+    some cases re-computing) the same defaults on every rerun.
+    """
+    defaults: Dict[str, Any] = {
+        "backend_url": "http://localhost:8000",
+        "latest_search_id": "",
+        "latest_cart_id": "",
+        "latest_reservation_id": "",
+        "geo_selected_ids": [],
+        "quote_template_id": 2,
+        "crm_clients_version": 0,
+    }
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
+
+
 def main() -> None:
     """Application entry point."""
     st.set_page_config(page_title="Travio Assistant", layout="wide")
-    if "backend_url" not in st.session_state:
-        st.session_state["backend_url"] = "http://localhost:8000"
+    _ensure_state()
 
     tabs = st.tabs(
         [
@@ -2,16 +2,57 @@
 
 from __future__ import annotations
 
+import atexit
+import re
 from typing import Any, Dict, Optional
 
 import httpx
+import orjson
+
+_CODE_RE = re.compile(r"[^a-z0-9]+")
+
+
+class BackendAPIError(Exception):
+    """Backend HTTP error with the JSON body parsed once at raise time.
+
+    ``code`` is the error detail slugged to snake_case (e.g. "Template
+    not found" -> "template_not_found") so callers can branch on it
+    instead of substring-scanning exception strings.
+    """
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+        self.code = _CODE_RE.sub("_", message.lower()).strip("_")
 
 
 class BackendClient:
-    """Synchronous HTTP client thin wrapper."""
+    """Synchronous HTTP client thin wrapper.
+
+    Holds one long-lived pooled client instead of opening a fresh
+    httpx.Client per call: every tab render issues several backend calls,
+    and reusing keep-alive connections saves a TCP (+TLS) handshake on
+    each of them.
+    """
 
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip("/")
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(10.0, read=30.0),
+            limits=httpx.Limits(
+                max_connections=40,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Close the pooled client; safe to call more than once."""
+        if not self._client.is_closed:
+            self._client.close()
 
     def request(
         self,
@@ -22,13 +63,28 @@ class BackendClient:
         json: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Perform HTTP request to backend and parse JSON response."""
-        url = f"{self.base_url}{path}"
-        with httpx.Client(timeout=httpx.Timeout(10.0, read=30.0)) as client:
-            response = client.request(method, url, params=params, json=json)
+        # Encode/decode with orjson rather than the stdlib encoder httpx
+        # would use; activity logs and pax lists get large enough for the
+        # difference to matter.
+        content = orjson.dumps(json) if json is not None else None
+        headers = {"Content-Type": "application/json"} if content is not None else None
+        response = self._client.request(
+            method, path, params=params, content=content, headers=headers
+        )
+        try:
             response.raise_for_status()
-            if not response.content:
-                return {}
-            return response.json()
+        except httpx.HTTPStatusError as exc:
+            try:
+                body = orjson.loads(exc.response.content) if exc.response.content else {}
+            except orjson.JSONDecodeError:
+                body = {}
+            detail = body.get("detail") or body.get("message") if isinstance(body, dict) else None
+            raise BackendAPIError(
+                exc.response.status_code, str(detail) if detail else str(exc)
+            ) from exc
+        if not response.content:
+            return {}
+        return orjson.loads(response.content)
 
     def get(self, path: str, *, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Shortcut for GET requests."""
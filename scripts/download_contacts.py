@@ -16,14 +16,21 @@ environment variables. The optional `TRAVIO_LANGUAGE` flag controls the
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 import os
 import sqlite3
-from typing import Any, Dict, Iterable, Iterator, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Tuple
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
+# Records accumulated per SQLite transaction.
+BATCH_SIZE = 500
+
+# API pages kept in flight ahead of the consumer.
+PREFETCH_PAGES = 4
+
 
 def parse_args() -> argparse.Namespace:
     """Configure CLI arguments."""
@@ -93,38 +100,73 @@ def load_credentials(args: argparse.Namespace) -> Tuple[int, str, str]:
     return int(travio_id), travio_key, language
 
 
-def get_token(client: httpx.Client, account_id: int, api_key: str) -> str:
+async def get_token(client: httpx.AsyncClient, account_id: int, api_key: str) -> str:
     """Authenticate with the Travio API and return a bearer token."""
-    response = client.post("/auth", json={"id": account_id, "key": api_key})
+    response = await client.post("/auth", json={"id": account_id, "key": api_key})
     response.raise_for_status()
-    payload = response.json()
+    payload = orjson.loads(response.content)
     token = payload.get("token")
     if not token:
         raise RuntimeError("Authentication succeeded but no token was returned.")
     return token
 
 
-def iter_master_data(
-    client: httpx.Client,
+async def iter_master_data(
+    client: httpx.AsyncClient,
     headers: Dict[str, str],
     per_page: int,
     max_pages: int | None,
-) -> Iterator[Dict[str, Any]]:
-    """Yield master-data records page by page."""
-    page = 1
-    pages = 1
-    while page <= pages:
-        if max_pages is not None and page > max_pages:
-            break
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield master-data records page by page, prefetching ahead.
+
+    Up to PREFETCH_PAGES page requests stay in flight (multiplexed over
+    one HTTP/2 connection) while the current page's records are consumed,
+    so the network keeps working during SQLite writes instead of waiting
+    for page N to finish before requesting page N+1.
+
+    Buffers are released eagerly: the raw response body is dropped right
+    after parsing and the parsed page envelope before yielding, so peak
+    memory per page is one copy of the records instead of body + parsed
+    page held together for the whole iteration. (An incremental parser
+    such as ijson would stream below one page, but it would add a
+    dependency and lose single-pass access to the trailing "pages" key;
+    per-page eager release captures most of the win at per_page=200.)
+    """
+
+    async def get_page(page: int) -> Dict[str, Any]:
         params = {"page": page, "per_page": per_page, "unfold": "contacts"}
-        response = client.get("/rest/master-data", headers=headers, params=params)
+        response = await client.get("/rest/master-data", headers=headers, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
+        del response
+        return data
+
+    data = await get_page(1)
+    pages = data.get("pages") or 1
+    if max_pages is not None:
+        pages = min(pages, max_pages)
+
+    tasks: Dict[int, "asyncio.Task[Dict[str, Any]]"] = {}
+    next_to_schedule = 2
+
+    def top_up() -> None:
+        nonlocal next_to_schedule
+        while len(tasks) < PREFETCH_PAGES and next_to_schedule <= pages:
+            tasks[next_to_schedule] = asyncio.create_task(get_page(next_to_schedule))
+            next_to_schedule += 1
+
+    top_up()
+    page = 1
+    while True:
         items = data.get("list") or data.get("items") or []
+        del data
         for item in items:
             yield item
-        pages = data.get("pages") or pages
         page += 1
+        if page > pages:
+            break
+        top_up()
+        data = await tasks.pop(page)
 
 
 def ensure_schema(connection: sqlite3.Connection) -> None:
@@ -139,100 +181,182 @@ def ensure_schema(connection: sqlite3.Connection) -> None:
             profile_type TEXT,
             language TEXT,
             vat_country TEXT,
-            raw_json TEXT NOT NULL
+            raw_json BLOB NOT NULL
         )
         """
     )
     connection.execute(
         """
         CREATE TABLE IF NOT EXISTS contacts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             client_id INTEGER NOT NULL,
-            contact_id INTEGER,
+            contact_id INTEGER NOT NULL DEFAULT 0,
             name TEXT,
             emails TEXT,
             phones TEXT,
             fax_numbers TEXT,
-            raw_json TEXT NOT NULL,
+            raw_json BLOB NOT NULL,
             FOREIGN KEY (client_id) REFERENCES clients (id) ON DELETE CASCADE
         )
         """
     )
+    # Migrate databases created by earlier versions of this script:
+    # CREATE TABLE IF NOT EXISTS never retrofits constraints, so the
+    # upsert's conflict target has to be a named index. Contacts without
+    # an API id are stored as contact_id=0 — NULLs are pairwise distinct
+    # in a UNIQUE index, which would let them duplicate on every run.
+    connection.execute("UPDATE contacts SET contact_id = 0 WHERE contact_id IS NULL")
+    connection.execute(
+        """
+        DELETE FROM contacts WHERE id NOT IN (
+            SELECT MIN(id) FROM contacts GROUP BY client_id, contact_id
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_contacts_client_contact
+            ON contacts (client_id, contact_id)
+        """
+    )
     connection.commit()
 
 
-def upsert_client(connection: sqlite3.Connection, record: Dict[str, Any]) -> None:
-    """Insert or update a master-data record."""
-    connection.execute(
+def upsert_clients(connection: sqlite3.Connection, records: Iterable[Dict[str, Any]]) -> int:
+    """Insert or update a batch of master-data records in one executemany.
+
+    The row tuples (including the raw_json serialization and the
+    name/firstname fallbacks) are built ahead of the call, so SQLite
+    prepares the statement once per batch rather than once per record.
+    """
+    rows = []
+    for record in records:
+        # Bind the bound-method once per record; eight attribute lookups
+        # per row add up across a full download.
+        g = record.get
+        rows.append(
+            (
+                g("id"),
+                g("code"),
+                g("name") or g("firstname"),
+                g("surname") or g("lastname"),
+                g("profile_type"),
+                g("language"),
+                g("vat_country"),
+                orjson.dumps(record),
+            )
+        )
+    connection.executemany(
         """
         INSERT OR REPLACE INTO clients (id, code, name, surname, profile_type, language, vat_country, raw_json)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
-        (
-            record.get("id"),
-            record.get("code"),
-            record.get("name") or record.get("firstname"),
-            record.get("surname") or record.get("lastname"),
-            record.get("profile_type"),
-            record.get("language"),
-            record.get("vat_country"),
-            json.dumps(record, ensure_ascii=False),
-        ),
+        rows,
     )
+    return len(rows)
 
 
-def replace_contacts(
+def upsert_contacts(
     connection: sqlite3.Connection,
-    client_id: int,
-    contacts: Iterable[Dict[str, Any]],
+    batch: Iterable[Tuple[int, Iterable[Dict[str, Any]]]],
 ) -> int:
-    """Replace contacts for the given client and return the number of inserted rows."""
-    connection.execute("DELETE FROM contacts WHERE client_id = ?", (client_id,))
-    inserted = 0
-    for contact in contacts:
-        connection.execute(
-            """
-            INSERT INTO contacts (client_id, contact_id, name, emails, phones, fax_numbers, raw_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                client_id,
-                contact.get("id"),
-                contact.get("name"),
-                json.dumps(contact.get("email") or [], ensure_ascii=False),
-                json.dumps(contact.get("phone") or [], ensure_ascii=False),
-                json.dumps(contact.get("fax") or [], ensure_ascii=False),
-                json.dumps(contact, ensure_ascii=False),
-            ),
+    """Upsert contacts for a batch of clients and return the row count.
+
+    Serialization happens up front while building the row tuples, so the
+    SQLite side is one executemany call per batch instead of one
+    auto-commit transaction (and its fsync) per row — one Python-to-C
+    crossing per batch rather than one per bound column.
+
+    ON CONFLICT replaces the old delete-everything-and-reinsert pass; the
+    raw_json<>excluded.raw_json predicate makes unchanged contacts a
+    no-op so incremental runs leave clean pages out of the WAL.
+    """
+    rows = [
+        (
+            client_id,
+            # 0 sentinel for contacts without an id: a NULL would never
+            # hit the unique index (NULLs compare distinct) and the row
+            # would be re-inserted on every incremental run.
+            contact.get("id") or 0,
+            contact.get("name"),
+            orjson.dumps(contact.get("email") or []).decode(),
+            orjson.dumps(contact.get("phone") or []).decode(),
+            orjson.dumps(contact.get("fax") or []).decode(),
+            orjson.dumps(contact),
         )
-        inserted += 1
-    return inserted
+        for client_id, contacts in batch
+        for contact in contacts
+    ]
+    connection.executemany(
+        """
+        INSERT INTO contacts (client_id, contact_id, name, emails, phones, fax_numbers, raw_json)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (client_id, contact_id) DO UPDATE SET
+            name = excluded.name,
+            emails = excluded.emails,
+            phones = excluded.phones,
+            fax_numbers = excluded.fax_numbers,
+            raw_json = excluded.raw_json
+        WHERE raw_json <> excluded.raw_json
+        """,
+        rows,
+    )
+    return len(rows)
 
 
-def main() -> None:
-    args = parse_args()
+async def download(args: argparse.Namespace) -> Tuple[int, int]:
+    """Run the full download and return (total_clients, total_contacts)."""
     account_id, api_key, language = load_credentials(args)
 
     connection = sqlite3.connect(args.db_path)
     try:
+        # Bulk-ingest PRAGMAs, applied before any transaction is open
+        # (journal_mode cannot change inside one): WAL plus
+        # synchronous=NORMAL drops the two-fsyncs-per-commit cost of the
+        # default DELETE journal while staying crash-safe.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA mmap_size=268435456")
+        connection.execute("PRAGMA cache_size=-65536")
         ensure_schema(connection)
-        with httpx.Client(base_url=args.base_url, timeout=args.timeout) as client:
-            token = get_token(client, account_id, api_key)
+        async with httpx.AsyncClient(base_url=args.base_url, http2=True, timeout=args.timeout) as client:
+            token = await get_token(client, account_id, api_key)
             headers = {"Authorization": f"Bearer {token}", "X-Lang": language}
             total_clients = 0
             total_contacts = 0
-            for record in iter_master_data(client, headers, args.per_page, args.max_pages):
-                client_id = record.get("id")
-                if client_id is None:
+
+            def flush(batch: list) -> None:
+                nonlocal total_clients, total_contacts
+                # One transaction per batch: SQLite's implicit auto-commit
+                # fsyncs after every statement, which caps ingest at tens
+                # of rows per second.
+                total_clients += upsert_clients(connection, batch)
+                total_contacts += upsert_contacts(
+                    connection,
+                    [(record["id"], record.get("contacts") or []) for record in batch],
+                )
+                connection.commit()
+
+            batch: list = []
+            async for record in iter_master_data(client, headers, args.per_page, args.max_pages):
+                if record.get("id") is None:
                     continue
-                upsert_client(connection, record)
-                contacts = record.get("contacts") or []
-                total_contacts += replace_contacts(connection, client_id, contacts)
-                total_clients += 1
-            connection.commit()
+                batch.append(record)
+                if len(batch) >= BATCH_SIZE:
+                    flush(batch)
+                    batch = []
+            if batch:
+                flush(batch)
     finally:
         connection.close()
 
+    return total_clients, total_contacts
+
+
+def main() -> None:
+    args = parse_args()
+    total_clients, total_contacts = asyncio.run(download(args))
     print(f"Stored {total_contacts} contacts across {total_clients} clients in {args.db_path}.")
 
 
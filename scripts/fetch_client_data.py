@@ -1,11 +1,14 @@
 import os
 import csv
 import argparse
-import requests
+import asyncio
+import httpx
 import sys
 import json
 from dotenv import load_dotenv
 
+import travio_auth
+
 # Load environment variables
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
@@ -15,156 +18,174 @@ TRAVIO_ID = os.getenv("TRAVIO_ID")
 TRAVIO_KEY = os.getenv("TRAVIO_KEY")
 TRAVIO_BASE_URL = os.getenv("TRAVIO_BASE_URL", "https://api.travio.it")
 
-def get_auth_token():
+# Concurrent detail fetches in flight; the per-client calls are pure
+# network latency, so fanning them out collapses N round-trips into
+# roughly N/CONCURRENCY.
+CONCURRENCY = 16
+
+async def get_auth_token(client):
     """Authenticates with Travio API and returns the Bearer token."""
     if not TRAVIO_ID or not TRAVIO_KEY:
         print("Error: TRAVIO_ID and TRAVIO_KEY must be set in environment or .env.local")
         sys.exit(1)
 
-    url = f"{TRAVIO_BASE_URL}/auth"
-    payload = {
-        "id": int(TRAVIO_ID),
-        "key": TRAVIO_KEY
-    }
-    
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        return response.json().get("token")
-    except requests.exceptions.RequestException as e:
+        # Cached-token reuse (and header setup) lives in travio_auth.
+        return await travio_auth.get_auth_token(client, TRAVIO_ID, TRAVIO_KEY)
+    except httpx.HTTPError as e:
         print(f"Authentication failed: {e}")
         sys.exit(1)
 
-def get_client_list(start_id, limit, token):
+async def get_client_list(client, start_id, limit):
     """Fetches a list of client IDs starting from start_id downwards."""
-    url = f"{TRAVIO_BASE_URL}/rest/master-data"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     # Filter: id <= start_id
     filters = [{"field": "id", "operator": "<=", "value": start_id}]
-    
+
     # Sort: id DESC
     sort_by = [["id", "DESC"]]
-    
+
     params = {
         "filters": json.dumps(filters),
         "sort_by": json.dumps(sort_by),
         "per_page": limit,
-        "page": 1
+        "page": 1,
+        # Unfold the nested records in the list response itself (the same
+        # trick download_contacts.py uses), so no per-client detail call
+        # is needed.
+        "unfold": "contacts,addresses"
     }
-    
+
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = await travio_auth.get_with_auth_retry(
+            client, TRAVIO_ID, TRAVIO_KEY, "/rest/master-data", params=params)
         response.raise_for_status()
         data = response.json()
         return data.get("list", [])
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error fetching client list: {e}")
         return []
 
-def fetch_client_details(client_id, token):
+async def fetch_client_details(client, client_id, sem):
     """Fetches full details for a single client."""
-    url = f"{TRAVIO_BASE_URL}/rest/master-data/{client_id}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 404:
+    async with sem:
+        try:
+            response = await travio_auth.get_with_auth_retry(
+                client, TRAVIO_ID, TRAVIO_KEY, f"/rest/master-data/{client_id}")
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json().get("data", {})
+        except httpx.HTTPError as e:
+            print(f"Error fetching client {client_id}: {e}")
             return None
-        response.raise_for_status()
-        return response.json().get("data", {})
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching client {client_id}: {e}")
-        return None
 
-def main():
-    parser = argparse.ArgumentParser(description="Fetch client data from Travio API.")
-    parser.add_argument("--start-id", type=int, default=390550, help="Client ID to start counting down from (default: 390550)")
-    parser.add_argument("--limit", type=int, default=100, help="Number of clients to fetch (default: 100)")
-    parser.add_argument("--output", type=str, default="clients_enhanced.csv", help="Output CSV file path")
-    
-    args = parser.parse_args()
-    
-    print("Authenticating...")
-    token = get_auth_token()
-    print("Authentication successful.")
-    
-    print(f"Fetching list of {args.limit} clients starting from ID {args.start_id} downwards...")
-    client_list = get_client_list(args.start_id, args.limit, token)
-    
-    if not client_list:
-        print("No clients found.")
-        return
-
-    print(f"Found {len(client_list)} clients in list. Fetching details...")
-    
+def build_row(client_data):
+    """Flatten a client detail payload into one CSV row."""
+    # Bind the bound-method once; the row build does ~15 lookups per
+    # client and each client_data.get repeats the attribute fetch.
+    g = client_data.get
+
+    # Extract address info (taking the first address found)
+    address_info = {}
+    addresses = g("addresses")
+    if addresses:
+        addr = addresses[0]
+        legacy = addr.get("legacy", {})
+        address_info = {
+            "address": addr.get("address"),
+            "postal_code": addr.get("postal_code"),
+            "city": legacy.get("city"),
+            "province": legacy.get("province"),
+            "country": legacy.get("country")
+        }
+
+    # Extract contact info
+    email = ""
+    phone = ""
+    contacts = g("contacts")
+    if contacts:
+        contact = contacts[0]
+        email = ", ".join(contact.get("email", [])) if contact.get("email") else ""
+        phone = ", ".join(contact.get("phone", [])) if contact.get("phone") else ""
+
+    return {
+        "id": g("id"),
+        "name": g("name"),
+        "surname": g("surname"),
+        "company_name": g("company_name"),
+        "full_name": g("full_name"),
+        "email": email,
+        "phone": phone,
+        "vat_number": g("vat_number"),
+        "tax_code": g("tax_code"),
+        "address": address_info.get("address"),
+        "postal_code": address_info.get("postal_code"),
+        "city": address_info.get("city"),
+        "province": address_info.get("province"),
+        "country": address_info.get("country"),
+        "gender": g("gender"),
+        "birth_date": g("birth")
+    }
+
+async def run(args):
+    async with httpx.AsyncClient(base_url=TRAVIO_BASE_URL, http2=True, timeout=30.0) as client:
+        print("Authenticating...")
+        await get_auth_token(client)
+        print("Authentication successful.")
+
+        print(f"Fetching list of {args.limit} clients starting from ID {args.start_id} downwards...")
+        client_list = await get_client_list(client, args.start_id, args.limit)
+
+        if not client_list:
+            print("No clients found.")
+            return
+
+        # One status line for the whole batch; a per-client print (and its
+        # stdout flush) would serialize against the event loop.
+        print(f"Found {len(client_list)} clients in list. Fetching details...")
+
+        # The unfolded list already carries contacts/addresses, so the
+        # N+1 detail calls are gone; fetch_client_details remains only as
+        # a bounded concurrent fallback for records the API returned
+        # without the unfolded fields. gather preserves list order so the
+        # CSV stays sorted by descending id.
+        sem = asyncio.Semaphore(CONCURRENCY)
+
+        async def ensure_detail(summary):
+            if "contacts" in summary or "addresses" in summary:
+                return summary
+            return await fetch_client_details(client, summary.get("id"), sem)
+
+        results = await asyncio.gather(
+            *(ensure_detail(summary) for summary in client_list)
+        )
+
     fieldnames = [
-        "id", "name", "surname", "company_name", "full_name", 
-        "email", "phone", "vat_number", "tax_code", 
+        "id", "name", "surname", "company_name", "full_name",
+        "email", "phone", "vat_number", "tax_code",
         "address", "postal_code", "city", "province", "country",
         "gender", "birth_date"
     ]
-    
-    with open(args.output, mode='w', newline='', encoding='utf-8') as csvfile:
+
+    rows = [build_row(client_data) for client_data in results if client_data]
+
+    # One writerows call into a 1 MB buffer instead of a writerow per
+    # client interleaved with the fetches.
+    with open(args.output, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        
-        count = 0
-        for client_summary in client_list:
-            client_id = client_summary.get("id")
-            print(f"Fetching details for client {client_id}...", end='\r')
-            
-            client_data = fetch_client_details(client_id, token)
-            
-            if client_data:
-                # Extract address info (taking the first address found)
-                address_info = {}
-                if client_data.get("addresses"):
-                    addr = client_data.get("addresses")[0]
-                    address_info = {
-                        "address": addr.get("address"),
-                        "postal_code": addr.get("postal_code"),
-                        "city": addr.get("legacy", {}).get("city"),
-                        "province": addr.get("legacy", {}).get("province"),
-                        "country": addr.get("legacy", {}).get("country")
-                    }
-                
-                # Extract contact info
-                email = ""
-                phone = ""
-                if client_data.get("contacts"):
-                    contact = client_data.get("contacts")[0]
-                    email = ", ".join(contact.get("email", [])) if contact.get("email") else ""
-                    phone = ", ".join(contact.get("phone", [])) if contact.get("phone") else ""
-
-                row = {
-                    "id": client_data.get("id"),
-                    "name": client_data.get("name"),
-                    "surname": client_data.get("surname"),
-                    "company_name": client_data.get("company_name"),
-                    "full_name": client_data.get("full_name"),
-                    "email": email,
-                    "phone": phone,
-                    "vat_number": client_data.get("vat_number"),
-                    "tax_code": client_data.get("tax_code"),
-                    "address": address_info.get("address"),
-                    "postal_code": address_info.get("postal_code"),
-                    "city": address_info.get("city"),
-                    "province": address_info.get("province"),
-                    "country": address_info.get("country"),
-                    "gender": client_data.get("gender"),
-                    "birth_date": client_data.get("birth")
-                }
-                writer.writerow(row)
-                count += 1
-            
-    print(f"\nDone. Fetched {count} clients. Saved to {args.output}")
+        writer.writerows(rows)
+
+    print(f"\nDone. Fetched {len(rows)} clients. Saved to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch client data from Travio API.")
+    parser.add_argument("--start-id", type=int, default=390550, help="Client ID to start counting down from (default: 390550)")
+    parser.add_argument("--limit", type=int, default=100, help="Number of clients to fetch (default: 100)")
+    parser.add_argument("--output", type=str, default="clients_enhanced.csv", help="Output CSV file path")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,15 @@
 import os
 import csv
 import argparse
-import requests
+import asyncio
+import httpx
 import sys
 import json
+import math
 from dotenv import load_dotenv
 
+import travio_auth
+
 # Load environment variables
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
@@ -15,109 +19,134 @@ TRAVIO_ID = os.getenv("TRAVIO_ID")
 TRAVIO_KEY = os.getenv("TRAVIO_KEY")
 TRAVIO_BASE_URL = os.getenv("TRAVIO_BASE_URL", "https://api.travio.it")
 
-def get_auth_token():
+# Items requested per page; large --limit values are split into pages of
+# this size and fetched concurrently.
+PAGE_SIZE = 200
+
+async def get_auth_token(client):
     """Authenticates with Travio API and returns the Bearer token."""
     if not TRAVIO_ID or not TRAVIO_KEY:
         print("Error: TRAVIO_ID and TRAVIO_KEY must be set in environment or .env.local")
         sys.exit(1)
 
-    url = f"{TRAVIO_BASE_URL}/auth"
-    payload = {
-        "id": int(TRAVIO_ID),
-        "key": TRAVIO_KEY
-    }
-    
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        return response.json().get("token")
-    except requests.exceptions.RequestException as e:
+        # Cached-token reuse (and header setup) lives in travio_auth.
+        return await travio_auth.get_auth_token(client, TRAVIO_ID, TRAVIO_KEY)
+    except httpx.HTTPError as e:
         print(f"Authentication failed: {e}")
         sys.exit(1)
 
-def fetch_services(limit, token):
-    url = f"{TRAVIO_BASE_URL}/rest/services"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
+async def fetch_services(client, limit):
+    """Fetch up to limit services, paging concurrently past page 1."""
     # Unfold geo to get city name if possible, though 'geo' field is complex.
     # We'll just fetch the list first.
+    per_page = min(limit, PAGE_SIZE)
     params = {
-        "per_page": limit,
+        "per_page": per_page,
         "page": 1,
         "sort_by": json.dumps([["name", "ASC"]])
     }
-    
+
     try:
-        response = requests.get(url, headers=headers, params=params)
+        # Preflight: page 1 tells us how many pages exist.
+        response = await travio_auth.get_with_auth_retry(
+            client, TRAVIO_ID, TRAVIO_KEY, "/rest/services", params=params)
         response.raise_for_status()
-        return response.json().get("list", [])
-    except requests.exceptions.RequestException as e:
+        data = response.json()
+        items = data.get("list", [])
+
+        wanted_pages = math.ceil(limit / per_page)
+        pages = min(data.get("pages") or 1, wanted_pages)
+        if pages > 1:
+            # Remaining pages go out concurrently over the pooled client.
+            responses = await asyncio.gather(
+                *(travio_auth.get_with_auth_retry(
+                    client, TRAVIO_ID, TRAVIO_KEY, "/rest/services",
+                    params={**params, "page": page})
+                  for page in range(2, pages + 1))
+            )
+            for page_response in responses:
+                page_response.raise_for_status()
+                items.extend(page_response.json().get("list", []))
+        return items[:limit]
+    except httpx.HTTPError as e:
         print(f"Error fetching services: {e}")
         return []
 
-def get_multilang_str(field, lang="en"):
-    if isinstance(field, dict):
-        return field.get(lang) or field.get("it") or str(field)
-    return str(field) if field else ""
+def make_lang_extractor(lang):
+    """Build a per-language extractor so the row loop skips re-binding lang.
+
+    The closure captures the target language once; each call is a single
+    isinstance check plus dict lookups with the same fallbacks as before.
+    """
+    def extract(field):
+        if isinstance(field, dict):
+            return field.get(lang) or field.get("it") or str(field)
+        return str(field) if field else ""
+    return extract
+
+async def run(args):
+    # One pooled client: every page request reuses the keep-alive
+    # connection opened by /auth instead of a fresh TCP+TLS handshake.
+    async with httpx.AsyncClient(base_url=TRAVIO_BASE_URL, http2=True, timeout=30.0) as client:
+        print("Authenticating...")
+        await get_auth_token(client)
+
+        print(f"Fetching {args.limit} services...")
+        services = await fetch_services(client, args.limit)
 
-def main():
-    parser = argparse.ArgumentParser(description="Fetch services from Travio API.")
-    parser.add_argument("--limit", type=int, default=100, help="Number of services to fetch (default: 100)")
-    parser.add_argument("--output", type=str, default="services.csv", help="Output CSV file path")
-    
-    args = parser.parse_args()
-    
-    print("Authenticating...")
-    token = get_auth_token()
-    
-    print(f"Fetching {args.limit} services...")
-    services = fetch_services(args.limit, token)
-    
     if not services:
         print("No services found.")
         return
 
     fieldnames = ["id", "name", "code", "type", "classification", "city", "description_snippet"]
-    
+
     with open(args.output, mode='w', newline='', encoding='utf-8') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        
+        extract_name = make_lang_extractor("en")
+
         for srv in services:
             # Extract description snippet
             desc_snippet = ""
             descriptions = srv.get("descriptions", [])
             if descriptions:
-                # Try to find english or italian
-                target_desc = next((d for d in descriptions if d.get("lang") == "en"), None)
-                if not target_desc:
-                    target_desc = next((d for d in descriptions if d.get("lang") == "it"), None)
-                
-                if target_desc and target_desc.get("paragraphs"):
+                # Index by language once: two O(1) lookups instead of up
+                # to two linear scans when "en" is missing.
+                by_lang = {d.get("lang"): d for d in descriptions}
+                target_desc = by_lang.get("en") or by_lang.get("it")
+
+                paragraphs = target_desc.get("paragraphs") if target_desc else None
+                if paragraphs:
                     # Get first paragraph text
-                    desc_snippet = target_desc.get("paragraphs")[0].get("text", "")[:100] + "..."
+                    desc_snippet = paragraphs[0].get("text", "")[:100] + "..."
 
             # Extract city from location or geo if available (simplified)
             # The 'geo' field in list response might be just IDs or a summary.
             # 'location' has lat/lng.
             # We'll leave city empty for now unless we fetch details, but let's check if 'geo' is useful.
             city = ""
-            
+
             row = {
                 "id": srv.get("id"),
-                "name": get_multilang_str(srv.get("name")),
+                "name": extract_name(srv.get("name")),
                 "code": srv.get("code"),
                 "type": srv.get("type"),
                 "classification": srv.get("classification"),
-                "city": city, 
+                "city": city,
                 "description_snippet": desc_snippet
             }
             writer.writerow(row)
-            
+
     print(f"Done. Fetched {len(services)} services. Saved to {args.output}")
 
+def main():
+    parser = argparse.ArgumentParser(description="Fetch services from Travio API.")
+    parser.add_argument("--limit", type=int, default=100, help="Number of services to fetch (default: 100)")
+    parser.add_argument("--output", type=str, default="services.csv", help="Output CSV file path")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,90 @@
+"""Shared auth-token cache for the standalone Travio scripts.
+
+Travio bearer tokens stay valid for about an hour, so each script run
+paying a fresh /auth round-trip is wasted latency. The token is cached
+in ~/.cache/travio/token.json (mode 0600 — it is a credential) with an
+expiry taken from the /auth response, and reused while it still has at
+least a minute left. A 401 on an API call drops the cache and re-auths
+once, so a token revoked early never wedges the scripts.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import orjson
+
+TOKEN_CACHE = Path(os.path.expanduser("~/.cache/travio/token.json"))
+
+# Fallback lifetime when /auth omits expires_in (tokens last ~1h; leave
+# some slack so we never present one about to expire).
+DEFAULT_TOKEN_TTL = 3500
+
+
+def read_cached_token():
+    """Return the cached token if it has >60s of validity left, else None."""
+    try:
+        cached = orjson.loads(TOKEN_CACHE.read_bytes())
+    except (FileNotFoundError, OSError, orjson.JSONDecodeError):
+        return None
+    if cached.get("exp", 0) > time.time() + 60:
+        return cached.get("token")
+    return None
+
+
+def write_cached_token(token, expires_in=None):
+    """Persist the token with its expiry; cache failures are non-fatal.
+
+    The lifetime comes from the /auth response when present (shaved to
+    90% like the backend's TravioClient does) and the file is created
+    0600 since it holds a live credential.
+    """
+    ttl = int(expires_in * 0.9) if expires_in else DEFAULT_TOKEN_TTL
+    payload = orjson.dumps({"token": token, "exp": time.time() + ttl})
+    try:
+        TOKEN_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as cache_file:
+            cache_file.write(payload)
+        # O_CREAT mode only applies to new files; fix up pre-existing ones.
+        os.chmod(TOKEN_CACHE, 0o600)
+    except OSError:
+        pass
+
+
+def invalidate_cached_token():
+    """Drop the cached token (e.g. after a 401 proved it stale)."""
+    try:
+        TOKEN_CACHE.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+async def get_auth_token(client, travio_id, travio_key):
+    """Return a bearer token, hitting /auth only on cache miss.
+
+    The Authorization/Content-Type headers are set on the client either
+    way, so callers keep the same contract as before.
+    """
+    token = read_cached_token()
+    if token is None:
+        response = await client.post("/auth", json={"id": int(travio_id), "key": travio_key})
+        response.raise_for_status()
+        payload = response.json()
+        token = payload.get("token")
+        write_cached_token(token, payload.get("expires_in"))
+    client.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    })
+    return token
+
+
+async def get_with_auth_retry(client, travio_id, travio_key, url, **kwargs):
+    """GET that re-authenticates once if the cached token gets a 401."""
+    response = await client.get(url, **kwargs)
+    if response.status_code == 401:
+        invalidate_cached_token()
+        await get_auth_token(client, travio_id, travio_key)
+        response = await client.get(url, **kwargs)
+    return response
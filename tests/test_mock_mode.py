@@ -12,7 +12,11 @@ from backend.app.main import app  # noqa: E402
 import pytest  # noqa: E402
 
 
-@pytest.fixture()
+# Module scope: TestClient(app) runs the FastAPI lifespan (including the
+# mock-data load) on entry, which dominated per-test setup when the
+# fixture was function-scoped. The tests only add CRM records, which the
+# mock store tolerates across tests.
+@pytest.fixture(scope="module")
 def client():
     with TestClient(app) as c:
         yield c